@@ -32,9 +32,9 @@ def main():
 
     def on_progress(info):
         """Progress callback that renders a terminal progress bar."""
-        phase = info.get('phase', '')
-        overall_progress = info.get('overall_progress', 0.0)
-        message = info.get('message', '')
+        phase = info.phase
+        overall_progress = info.overall_progress
+        message = info.message
 
         # Format the display message
         phase_display = phase.upper()
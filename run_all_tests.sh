@@ -48,7 +48,13 @@ run_test "ETL Pipeline Tests" "python test_etl_pipeline.py"
 run_test "Network Layer Tests" "python test_network_layer.py"
 
 # 4. Integration Tests (Phase 1-4)
-run_test "Integration Tests" "python -m pytest tests/test_integration.py -v --tb=short"
+# The async tests wait on real asyncio.sleep() calls; spread them over
+# worker processes when pytest-xdist is installed
+XDIST_ARGS=""
+if python -c "import xdist" 2>/dev/null; then
+    XDIST_ARGS="-n auto"
+fi
+run_test "Integration Tests" "python -m pytest tests/test_integration.py $XDIST_ARGS -v --tb=short"
 
 # 5. All pytest tests together
 run_test "All Pytest Tests" "python -m pytest tests/ -v --tb=short"
@@ -9,15 +9,14 @@ from pathlib import Path
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
-# Read requirements
-requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    requirements = [
-        line.strip()
-        for line in requirements_file.read_text(encoding="utf-8").splitlines()
-        if line.strip() and not line.startswith("#")
-    ]
+# Runtime dependencies; requirements.txt additionally pins the optional
+# accelerators and the development tools for a full checkout
+requirements = [
+    "PyQt6>=6.4.0",
+    "PyQt6-Qt6>=6.4.0",
+    "demoparser2>=0.1.0",
+    "psutil>=5.9.0",
+]
 
 setup(
     name="cs2-input-visualizer",
@@ -46,8 +45,9 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.4.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.1.0",
+            "pytest-xdist>=3.3.0",
             "flake8>=6.0.0",
             "mypy>=1.5.0",
             "black>=23.7.0",
@@ -55,6 +55,13 @@ setup(
         "msgpack": [
             "msgpack>=1.0.0",
         ],
+        # Optional accelerators, each used only when installed
+        "fast": [
+            "msgpack>=1.0.0",
+            "orjson>=3.8.0",
+            "xxhash>=3.0.0",
+            "pyahocorasick>=2.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
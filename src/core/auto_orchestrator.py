@@ -10,7 +10,8 @@ This module provides the AutoOrchestrator which handles:
 The orchestrator runs three concurrent loops:
 1. Demo monitoring (500ms) - detects demo loads/switches
 2. Spectator tracking (1s) - tracks player changes
-3. Render loop (60 FPS) - displays input visualization
+3. Render loop (60 FPS) - displays input visualization; idles on an
+   asyncio.Event until a demo is loaded
 """
 
 import asyncio
@@ -43,9 +44,13 @@ class AutoOrchestrator:
     Three concurrent loops run:
     - Demo monitoring: 500ms interval
     - Spectator tracking: 1s interval
-    - Render loop: 60 FPS
+    - Render loop: 60 FPS while a demo is loaded; while idle it only
+      services Qt events and wakes as soon as a demo or player is ready
     """
 
+    # Qt event servicing interval while no demo is loaded (seconds)
+    IDLE_INTERVAL = 0.1
+
     def __init__(
         self,
         config: Optional[Union[AppConfig, Path]] = None,
@@ -100,6 +105,9 @@ class AutoOrchestrator:
         self._current_player: Optional[str] = None
         self._current_tick = 0
 
+        # Set whenever demo/player state changes, to wake the idle render loop
+        self._wake = asyncio.Event()
+
         # Tasks
         self._demo_task: Optional[asyncio.Task] = None
         self._spectator_task: Optional[asyncio.Task] = None
@@ -188,10 +196,13 @@ class AutoOrchestrator:
     async def stop(self):
         """Graceful shutdown."""
         if not self._running:
+            # Never started (or already stopped): just release the hash index
+            self.cache_validator.close()
             return
 
         print("[AutoOrchestrator] Shutting down...")
         self._running = False
+        self._wake.set()
 
         # Cancel tasks
         for task in [self._demo_task, self._spectator_task, self._render_task]:
@@ -209,6 +220,9 @@ class AutoOrchestrator:
         if self.overlay:
             self.overlay.hide()
 
+        # Close the cache validator's hash index
+        self.cache_validator.close()
+
         print("[AutoOrchestrator] Shutdown complete")
 
     async def _demo_monitoring_loop(self):
@@ -242,7 +256,7 @@ class AutoOrchestrator:
         cache_path = self.cache_validator.get_cache_path(demo_path)
 
         # Check if cache needs rebuild (invalid or doesn't exist)
-        needs_rebuild = not self.cache_validator.is_cache_valid(demo_path)
+        needs_rebuild = not await self.cache_validator.is_cache_valid_async(demo_path)
 
         if needs_rebuild:
             print("[AutoOrchestrator] Cache invalid or missing, running ETL...")
@@ -272,6 +286,8 @@ class AutoOrchestrator:
             print(f"[AutoOrchestrator] Error getting player: {e}")
             self._current_player = None
 
+        self._wake.set()
+
     async def _spectator_tracking_loop(self):
         """Monitor spectator target changes (1s interval)."""
         print("[AutoOrchestrator] Spectator tracking loop started")
@@ -299,6 +315,7 @@ class AutoOrchestrator:
         # Update current player if steam_id matches loaded data
         if steam_id != "unknown":
             self._current_player = steam_id
+            self._wake.set()
 
     async def _render_loop(self):
         """60 FPS rendering loop."""
@@ -307,6 +324,18 @@ class AutoOrchestrator:
         frame_time = 1.0 / 60  # 60 FPS
 
         while self._running:
+            if not (self._current_player and self._current_demo):
+                # Nothing to draw: keep Qt responsive without polling telnet,
+                # and resume rendering as soon as a demo/player is ready
+                if self.app:
+                    self.app.processEvents()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.IDLE_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                continue
+
             try:
                 # Process Qt events
                 if self.app:
@@ -315,18 +344,17 @@ class AutoOrchestrator:
                 # Get current tick from telnet
                 self._current_tick = await self.telnet_client.get_current_tick()
 
-                # Render if we have data
-                if self._current_player and self._current_demo:
-                    input_data = self.demo_repository.get_inputs(
-                        self._current_tick,
-                        self._current_player
-                    )
-
-                    if input_data and self.overlay:
-                        self.overlay.update_inputs(input_data)
-                    elif self.overlay:
-                        # Clear visualization if no input
-                        self.overlay.update_inputs(None)
+                # Render current tick
+                input_data = self.demo_repository.get_inputs(
+                    self._current_tick,
+                    self._current_player
+                )
+
+                if input_data and self.overlay:
+                    self.overlay.update_inputs(input_data)
+                elif self.overlay:
+                    # Clear visualization if no input
+                    self.overlay.update_inputs(None)
 
             except Exception as e:
                 print(f"[AutoOrchestrator] Render error: {e}")
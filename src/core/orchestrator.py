@@ -383,7 +383,7 @@ class Orchestrator:
                     # Pass speed multiplier to visualizer for speed-aware rendering
                     if input_data:
                         # Add speed metadata to input_data if visualizer supports it
-                        if hasattr(input_data, '__dict__'):
+                        if hasattr(input_data, 'playback_speed'):
                             input_data.playback_speed = current_speed
 
                         self.visualizer.render(input_data)
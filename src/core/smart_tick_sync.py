@@ -10,21 +10,35 @@ This module provides advanced tick synchronization that:
 
 import time
 import logging
-from typing import Optional, List, Tuple
-from collections import deque
+from typing import Callable, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-class TickMeasurement:
-    """Single tick measurement with timestamp."""
-
-    def __init__(self, tick: int, timestamp: float):
-        self.tick = tick
-        self.timestamp = timestamp
-
-    def __repr__(self):
-        return f"TickMeasurement(tick={self.tick}, time={self.timestamp:.3f})"
+def _window_delta(
+    hist_t: List[float],
+    hist_tick: List[int],
+    head: int,
+    window: int,
+    size: int
+) -> Tuple[int, float]:
+    """Tick and time deltas between the ends of a ring buffer window.
+
+    Args:
+        hist_t: Timestamp ring buffer
+        hist_tick: Tick ring buffer
+        head: Next slot to be written (one past the newest entry)
+        window: Number of most recent entries spanned
+        size: Ring buffer capacity
+
+    Returns:
+        Tuple[int, float]: (tick_diff, time_diff) from oldest to newest entry
+    """
+    newest = head - 1 if head else size - 1
+    oldest = head - window
+    if oldest < 0:
+        oldest += size
+    return hist_tick[newest] - hist_tick[oldest], hist_t[newest] - hist_t[oldest]
 
 
 class SmartTickSync:
@@ -38,13 +52,17 @@ class SmartTickSync:
     It uses demo_marktick command which is passive (doesn't pause demo).
     """
 
+    # Exponential moving average factor for speed smoothing
+    SPEED_SMOOTHING = 0.3
+
     def __init__(
         self,
         tick_source,
         tick_rate: int = 64,
         history_size: int = 10,
         pause_threshold: int = 3,
-        speed_calculation_window: int = 5
+        speed_calculation_window: int = 5,
+        time_fn: Callable[[], float] = time.monotonic
     ):
         """Initialize smart tick sync.
 
@@ -54,18 +72,29 @@ class SmartTickSync:
             history_size: Number of measurements to keep in history (default: 10)
             pause_threshold: Number of identical ticks to consider paused (default: 3)
             speed_calculation_window: Number of measurements for speed calc (default: 5)
+            time_fn: Clock returning seconds, used for all measurements and
+                predictions (default: time.monotonic). Tests pass a fake clock.
         """
         self.tick_source = tick_source
         self.tick_rate = tick_rate
         self.history_size = history_size
         self.pause_threshold = pause_threshold
         self.speed_calculation_window = speed_calculation_window
+        self._now = time_fn
 
-        # Tick history: recent measurements
-        self._history: deque[TickMeasurement] = deque(maxlen=history_size)
+        # Tick history: fixed-size ring buffer of recent measurements.
+        # Slots are preallocated so update() never allocates per sample;
+        # _head is the next slot to write, _count the number of valid slots.
+        self._hist_t: List[float] = [0.0] * history_size
+        self._hist_tick: List[int] = [0] * history_size
+        self._head = 0
+        self._count = 0
 
         # Current state
         self._current_speed = 1.0  # Playback speed multiplier
+        # False until the EMA is seeded from measurements; cleared again
+        # when a tick jump restarts the history
+        self._speed_seeded = False
         self._is_paused = False
         self._last_tick = 0
         self._last_update_time = 0.0
@@ -82,13 +111,17 @@ class SmartTickSync:
         try:
             # Get tick from source (demo_marktick - passive, no pause)
             tick = await self.tick_source.get_current_tick()
-            current_time = time.time()
+            current_time = self._now()
 
             # Add to history
-            measurement = TickMeasurement(tick, current_time)
-            self._history.append(measurement)
+            head = self._head
+            self._hist_t[head] = current_time
+            self._hist_tick[head] = tick
+            self._head = (head + 1) % self.history_size
+            if self._count < self.history_size:
+                self._count += 1
 
-            logger.debug(f"[SmartTickSync] Measured: tick={tick} at t={current_time:.3f}")
+            logger.debug("[SmartTickSync] Measured: tick=%d at t=%.3f", tick, current_time)
 
             # Update state
             self._last_tick = tick
@@ -112,44 +145,57 @@ class SmartTickSync:
 
         We use linear regression over the last N measurements for stability.
 
+        The first measurement after startup or a tick jump seeds the speed
+        through recompute_smoothed_speed() instead of being blended with the
+        1.0x default or the speed from before the jump, so slow playback is
+        not rejected as an outlier of a speed it never had.
+
         Edge cases handled:
-        - Tick jumps (Shift+F2 goto): Discard measurements with sudden large jumps
+        - Tick jumps (Shift+F2 goto): Restart the history at the new tick
         - Outliers: Discard speed measurements far from recent average
         """
-        if len(self._history) < 2:
+        count = self._count
+        if count < 2:
             # Not enough data
             self._current_speed = 1.0
             return
 
         # Use last N measurements for speed calculation
-        window_size = min(self.speed_calculation_window, len(self._history))
-        recent = list(self._history)[-window_size:]
+        window_size = min(self.speed_calculation_window, count)
 
         # Calculate average speed over window
         # Use oldest and newest measurement for stability
-        oldest = recent[0]
-        newest = recent[-1]
-
-        tick_diff = newest.tick - oldest.tick
-        time_diff = newest.timestamp - oldest.timestamp
+        tick_diff, time_diff = _window_delta(
+            self._hist_t, self._hist_tick, self._head, window_size, self.history_size
+        )
 
         # Avoid division by zero
         if time_diff < 0.01:
             # Too short time interval, keep previous speed
-            logger.debug(f"[SmartTickSync] Time diff too small ({time_diff:.3f}s), keeping speed={self._current_speed:.2f}x")
+            logger.debug("[SmartTickSync] Time diff too small (%.3fs), keeping speed=%.2fx",
+                         time_diff, self._current_speed)
             return
 
         # Edge Case 1: Detect tick jumps (Shift+F2 goto)
         # If tick_diff is way larger than expected, likely a jump
-        if len(self._history) >= 3:
+        if count >= 3:
             expected_diff = self.tick_rate * time_diff * self._current_speed
             if abs(tick_diff) > abs(expected_diff) * 5:
-                logger.warning(f"[SmartTickSync] Tick jump detected: {tick_diff} ticks "
-                              f"(expected ~{expected_diff:.0f}), discarding measurement")
-                # Remove the newest measurement that caused the jump
-                self._history.pop()
+                logger.warning("[SmartTickSync] Tick jump detected: %d ticks "
+                               "(expected ~%.0f), restarting history",
+                               tick_diff, expected_diff)
+                # Samples from before the jump say nothing about the speed
+                # after it: keep only the newest one (the post-jump tick)
+                # and reseed the speed once the next sample arrives
+                self._count = 1
+                self._speed_seeded = False
                 return
 
+        if not self._speed_seeded:
+            self.recompute_smoothed_speed()
+            self._speed_seeded = True
+            return
+
         # Calculate tick rate (ticks per second)
         measured_tick_rate = tick_diff / time_diff
 
@@ -167,13 +213,48 @@ class SmartTickSync:
             return
 
         # Smooth speed changes (exponential moving average)
-        alpha = 0.3  # Smoothing factor
+        alpha = self.SPEED_SMOOTHING
         self._current_speed = alpha * speed + (1 - alpha) * self._current_speed
 
-        logger.debug(f"[SmartTickSync] Speed calculation: "
-                    f"tick_diff={tick_diff}, time_diff={time_diff:.3f}s, "
-                    f"measured_rate={measured_tick_rate:.1f} tps, "
-                    f"speed={speed:.2f}x, smoothed={self._current_speed:.2f}x")
+        logger.debug("[SmartTickSync] Speed calculation: "
+                     "tick_diff=%d, time_diff=%.3fs, measured_rate=%.1f tps, "
+                     "speed=%.2fx, smoothed=%.2fx",
+                     tick_diff, time_diff, measured_tick_rate,
+                     speed, self._current_speed)
+
+    def recompute_smoothed_speed(self) -> float:
+        """Recompute the smoothed speed from the whole tick history.
+
+        Runs the exponential moving average over consecutive pairs of
+        measurements, oldest first, seeded with the first pair's speed
+        instead of the 1.0x default. Pairs less than 10ms apart are skipped.
+        Used to seed the speed after startup or a tick jump; with fewer than
+        two usable measurements the current speed is kept.
+
+        Returns:
+            float: The recomputed speed multiplier
+        """
+        size = self.history_size
+        alpha = self.SPEED_SMOOTHING
+        smoothed: Optional[float] = None
+
+        start = (self._head - self._count) % size
+        prev = start
+        for k in range(1, self._count):
+            cur = (start + k) % size
+            time_diff = self._hist_t[cur] - self._hist_t[prev]
+            if time_diff >= 0.01:
+                tick_diff = self._hist_tick[cur] - self._hist_tick[prev]
+                speed = max(0.05, min(5.0, tick_diff / time_diff / self.tick_rate))
+                smoothed = speed if smoothed is None else alpha * speed + (1 - alpha) * smoothed
+                prev = cur
+            # else: fold this sample into the next pair
+
+        if smoothed is not None:
+            self._current_speed = smoothed
+        logger.debug("[SmartTickSync] Recomputed speed from %d measurements: %.2fx",
+                     self._count, self._current_speed)
+        return self._current_speed
 
     def _is_outlier(self, speed: float, threshold: float = 0.5) -> bool:
         """Check if speed measurement is an outlier.
@@ -190,7 +271,7 @@ class SmartTickSync:
             bool: True if outlier, False otherwise
         """
         # Need at least some history to compare
-        if len(self._history) < 3:
+        if self._count < 3:
             return False
 
         # Calculate deviation from current speed
@@ -210,20 +291,25 @@ class SmartTickSync:
         - Demo not loaded (tick=0)
         - Very slow playback (ticks still change, just slowly)
         """
-        if len(self._history) < self.pause_threshold:
+        if self._count < self.pause_threshold:
             self._is_paused = False
             return
 
         # Get last N measurements
-        recent = list(self._history)[-self.pause_threshold:]
+        size = self.history_size
+        newest = (self._head - 1) % size
+        oldest = (self._head - self.pause_threshold) % size
+        hist_tick = self._hist_tick
 
         # Check if all ticks are identical
-        ticks = [m.tick for m in recent]
-        all_same = len(set(ticks)) == 1
-        tick_value = ticks[0]
+        tick_value = hist_tick[oldest]
+        all_same = all(
+            hist_tick[(oldest + i) % size] == tick_value
+            for i in range(1, self.pause_threshold)
+        )
 
         # Check time has passed
-        time_diff = recent[-1].timestamp - recent[0].timestamp
+        time_diff = self._hist_t[newest] - self._hist_t[oldest]
 
         # Pause detection logic:
         # - All ticks same AND tick > 0 AND time passed
@@ -270,7 +356,7 @@ class SmartTickSync:
         """Get timestamp of last update.
 
         Returns:
-            float: Unix timestamp of last update
+            float: Time of last update, as returned by the clock (time_fn)
         """
         return self._last_update_time
 
@@ -299,7 +385,7 @@ class SmartTickSync:
             return 0
 
         # Calculate time elapsed since last update
-        time_elapsed = time.time() - self._last_update_time
+        time_elapsed = self._now() - self._last_update_time
 
         # Predict ticks elapsed using current speed
         # ticks_per_second = tick_rate * speed
@@ -326,9 +412,12 @@ class SmartTickSync:
             "is_paused": self._is_paused,
             "last_tick": self._last_tick,
             "last_update_time": self._last_update_time,
-            "history_size": len(self._history),
+            "history_size": self._count,
             "history": [
-                {"tick": m.tick, "time": m.timestamp}
-                for m in self._history
+                {"tick": self._hist_tick[i], "time": self._hist_t[i]}
+                for i in (
+                    (self._head - self._count + k) % self.history_size
+                    for k in range(self._count)
+                )
             ]
         }
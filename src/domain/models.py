@@ -8,12 +8,13 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class InputData:
     """Player input state for a single tick.
 
     Represents all input actions (keyboard, mouse) that occurred during
-    a specific game tick, including subtick timing information.
+    a specific game tick, including subtick timing information. Instances
+    are created per tick, so the class uses __slots__ (no per-instance dict).
 
     Attributes:
         tick: The game tick number when this input occurred
@@ -32,7 +33,7 @@ class InputData:
     playback_speed: Optional[float] = 1.0  # Default to 1.0x (normal speed)
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerInfo:
     """Player identification information.
 
@@ -48,7 +49,7 @@ class PlayerInfo:
     entity_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DemoMetadata:
     """Demo file metadata.
 
@@ -5,9 +5,29 @@ pre-parsed demo data for UI development and testing.
 """
 
 import json
+import math
 import sys
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+
+# Optional orjson support (faster cache decoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional MessagePack support (binary cache files)
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Cache suffixes decoded as MessagePack (same as CacheManager)
+MSGPACK_EXTENSIONS = ('.msgpack', '.msgpk', '.mpk')
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -15,11 +35,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from interfaces.demo_repository import IDemoRepository
 from domain.models import InputData
 
+# Subtick offsets are fractions of a tick in [0.0, 1.0). They are kept as
+# unsigned Q0.8 fixed point, one byte each: value * 256 rounded, so a
+# decoded value is within 1/512 of the cached one. Values above 255/256
+# saturate at 255/256.
+SUBTICK_SCALE = 256
+
+# Value of metadata["subtick_format"] in caches whose subtick values are
+# already Q0.8 codes (ints 0-255). Caches without the marker, i.e. all
+# caches written so far, hold float offsets and are quantized on load.
+SUBTICK_FORMAT = "q0.8"
+
+# Largest tick span (last - first tick with input) given a dense
+# tick -> row index; 4 bytes per tick, so 4 MiB at most (about 4.5 hours
+# at 64 tick). Longer spans fall back to binary search over _ticks.
+MAX_DENSE_TICK_SPAN = 1 << 20
+
 
 class MockDemoRepository(IDemoRepository):
-    """Mock demo repository that loads data from JSON cache files.
+    """Mock demo repository that loads data from JSON or MessagePack cache files.
 
-    This implementation loads pre-parsed demo data from a JSON cache file,
+    This implementation loads pre-parsed demo data from a cache file,
     allowing UI development and testing without requiring real demo parsing
     or the demoparser2 library.
 
@@ -42,10 +78,35 @@ class MockDemoRepository(IDemoRepository):
             }
         }
 
+    metadata may also carry "subtick_format": "q0.8", in which case the
+    subtick values are Q0.8 codes (0-255) rather than fractions of a tick.
+
+    Inputs are not kept as per-tick dicts. At load time they are packed into
+    parallel columns (structure of arrays): a sorted tick array, an index
+    into a table of distinct (keys, mouse, subtick keys) combinations, and a
+    flat array of subtick values. Real demos repeat a small number of key
+    combinations across thousands of ticks, so lookups touch a few compact
+    arrays instead of per-tick dicts, and get_inputs() builds InputData on
+    demand. Subtick values are stored at 1/256 tick resolution, so
+    get_inputs() returns them to within 1/512 of the cached value.
+
     Attributes:
-        cache_data: Loaded cache data dictionary
+        cache_data: Loaded cache data dictionary, as read from the file
         player_id: Default player ID from cache metadata
         tick_range: Valid tick range from cache metadata
+        _ticks: Sorted tick numbers that have input
+        _combo_idx: Per tick, index into _combos
+        _combos: Distinct (keys, mouse, subtick_keys) tuples
+        _sub_offsets: Per tick, start of its values in _sub_values
+                      (one extra trailing entry marks the end)
+        _sub_values: Subtick values of all ticks, back to back, as Q0.8
+                     codes (one byte each, value * SUBTICK_SCALE); see
+                     SUBTICK_FORMAT
+        _timestamps: Per tick timestamp, NaN when absent
+        _tick0: First tick with input (base of _row_of_tick)
+        _row_of_tick: Row in the columns for tick _tick0 + i, -1 when that
+                      tick has no input; empty when the span exceeds
+                      MAX_DENSE_TICK_SPAN
         _loaded: Flag indicating if demo is loaded
 
     Example:
@@ -61,15 +122,18 @@ class MockDemoRepository(IDemoRepository):
         self.player_id: str = ""
         self.tick_range: tuple[int, int] = (0, 0)
         self._loaded: bool = False
+        self._clear_inputs()
 
     def load_demo(self, demo_path: str) -> bool:
-        """Load demo data from JSON cache file.
+        """Load demo data from a JSON or MessagePack cache file.
 
-        Attempts to load and parse a JSON cache file. If the file doesn't
+        Attempts to load and parse a cache file. If the file doesn't
         exist or is invalid, initializes with empty data and logs a warning.
+        Files with a .msgpack/.msgpk/.mpk suffix are decoded as MessagePack;
+        anything else is JSON, decoded with orjson when it is installed.
 
         Args:
-            demo_path: Path to JSON cache file (can be relative or absolute)
+            demo_path: Path to cache file (can be relative or absolute)
 
         Returns:
             bool: True if loaded successfully, False if file not found
@@ -91,14 +155,33 @@ class MockDemoRepository(IDemoRepository):
             return False
 
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                self.cache_data = json.load(f)
+            raw = cache_path.read_bytes()
+            if cache_path.suffix.lower() in MSGPACK_EXTENSIONS:
+                if not MSGPACK_AVAILABLE:
+                    raise ImportError(
+                        "msgpack library not installed. Install with: pip install msgpack"
+                    )
+                self.cache_data = msgpack.unpackb(raw, raw=False, strict_map_key=False)
+            elif ORJSON_AVAILABLE:
+                self.cache_data = orjson.loads(raw)
+            else:
+                self.cache_data = json.loads(raw)
 
             # Extract metadata
             metadata = self.cache_data.get("metadata", {})
             self.player_id = metadata.get("player_id", "MOCK_PLAYER")
-            tick_range_list = metadata.get("tick_range", [0, 10000])
-            self.tick_range = (tick_range_list[0], tick_range_list[1])
+
+            self._index_inputs()
+
+            # Fall back to the first/last tick with input when the cache
+            # metadata does not record the range
+            tick_range_list = metadata.get("tick_range")
+            if tick_range_list is not None:
+                self.tick_range = (tick_range_list[0], tick_range_list[1])
+            elif self._ticks:
+                self.tick_range = (self._ticks[0], self._ticks[-1])
+            else:
+                self.tick_range = (0, 10000)
 
             self._loaded = True
             return True
@@ -130,8 +213,76 @@ class MockDemoRepository(IDemoRepository):
         }
         self.player_id = "MOCK_PLAYER_123"
         self.tick_range = (0, 10000)
+        self._clear_inputs()
         self._loaded = True
 
+    def _clear_inputs(self) -> None:
+        """Reset the input columns to empty."""
+        self._ticks = array('q')
+        self._combo_idx = array('I')
+        self._combos: List[Tuple[tuple, tuple, tuple]] = []
+        self._sub_offsets = array('I', [0])
+        self._sub_values = array('B')
+        self._timestamps = array('d')
+        self._tick0 = 0
+        self._row_of_tick = array('i')
+
+    def _index_inputs(self) -> None:
+        """Pack the loaded cache's inputs into columns, sorted by tick.
+
+        cache_data itself is left unchanged. Float subtick values are
+        quantized to Q0.8; caches marked with SUBTICK_FORMAT already hold
+        the codes and are copied as is.
+        """
+        self._clear_inputs()
+        combo_ids: Dict[Tuple[tuple, tuple, tuple], int] = {}
+        inputs = self.cache_data.get("inputs", {})
+        metadata = self.cache_data.get("metadata", {})
+        quantized = metadata.get("subtick_format") == SUBTICK_FORMAT
+
+        for tick, tick_data in sorted(
+            (int(tick_str), tick_data) for tick_str, tick_data in inputs.items()
+        ):
+            subtick = tick_data.get("subtick", {})
+            combo = (
+                tuple(tick_data.get("keys", [])),
+                tuple(tick_data.get("mouse", [])),
+                tuple(subtick)
+            )
+            combo_id = combo_ids.get(combo)
+            if combo_id is None:
+                combo_id = combo_ids[combo] = len(self._combos)
+                self._combos.append(combo)
+
+            timestamp = tick_data.get("timestamp")
+
+            self._ticks.append(tick)
+            self._combo_idx.append(combo_id)
+            if quantized:
+                self._sub_values.extend(subtick.values())
+            else:
+                self._sub_values.extend(
+                    min(255, max(0, round(value * SUBTICK_SCALE)))
+                    for value in subtick.values()
+                )
+            self._sub_offsets.append(len(self._sub_values))
+            self._timestamps.append(math.nan if timestamp is None else timestamp)
+
+        self._index_rows()
+
+    def _index_rows(self) -> None:
+        """Build the dense tick -> row index so lookups skip the binary search."""
+        ticks = self._ticks
+        if not ticks or ticks[-1] - ticks[0] >= MAX_DENSE_TICK_SPAN:
+            return
+
+        tick0 = ticks[0]
+        row_of_tick = array('i', [-1]) * (ticks[-1] - tick0 + 1)
+        for row, tick in enumerate(ticks):
+            row_of_tick[tick - tick0] = row
+        self._tick0 = tick0
+        self._row_of_tick = row_of_tick
+
     def get_inputs(self, tick: int, player_id: str) -> Optional[InputData]:
         """Get input data for a specific tick and player.
 
@@ -156,28 +307,43 @@ class MockDemoRepository(IDemoRepository):
         if not self._loaded:
             return None
 
-        inputs_dict = self.cache_data.get("inputs", {})
-        tick_str = str(tick)
-
-        if tick_str not in inputs_dict:
-            return None
-
-        tick_data = inputs_dict[tick_str]
+        row_of_tick = self._row_of_tick
+        if row_of_tick:
+            offset = tick - self._tick0
+            if offset < 0 or offset >= len(row_of_tick):
+                return None
+            i = row_of_tick[offset]
+            if i < 0:
+                return None
+        else:
+            ticks = self._ticks
+            i = bisect_left(ticks, tick)
+            if i == len(ticks) or ticks[i] != tick:
+                return None
+
+        return self._reconstruct(i)
+
+    def _reconstruct(self, i: int) -> InputData:
+        """Build InputData for the i-th row of the packed columns."""
+        keys, mouse, subtick_keys = self._combos[self._combo_idx[i]]
+        values = self._sub_values[self._sub_offsets[i]:self._sub_offsets[i + 1]]
+        timestamp = self._timestamps[i]
 
-        # Convert dict to InputData object
         return InputData(
-            tick=tick_data.get("tick", tick),
-            keys=tick_data.get("keys", []),
-            mouse=tick_data.get("mouse", []),
-            subtick=tick_data.get("subtick", {}),
-            timestamp=tick_data.get("timestamp")
+            tick=self._ticks[i],
+            keys=list(keys),
+            mouse=list(mouse),
+            subtick={key: value / SUBTICK_SCALE
+                     for key, value in zip(subtick_keys, values)},
+            timestamp=None if math.isnan(timestamp) else timestamp
         )
 
     def get_tick_range(self) -> tuple[int, int]:
         """Get the range of available ticks in the loaded demo.
 
         Returns:
-            tuple: (min_tick, max_tick) from cache metadata
+            tuple: (min_tick, max_tick) from cache metadata, or the first
+                   and last tick with input if the metadata has no range
 
         Raises:
             RuntimeError: If no demo is currently loaded
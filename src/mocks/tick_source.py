@@ -7,6 +7,7 @@ CS2 demo playback without requiring a real game connection.
 import time
 import sys
 from pathlib import Path
+from typing import Callable
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -26,7 +27,8 @@ class MockTickSource(ITickSource):
     Attributes:
         start_tick: Initial tick number when timer starts
         tick_rate: Ticks per second (e.g., 64 for CS2 servers)
-        start_time: Unix timestamp when connection was established
+        start_time: Clock reading when connection was established
+        clock: Time source in seconds (time.monotonic unless injected)
         _connected: Current connection state
 
     Example:
@@ -36,28 +38,37 @@ class MockTickSource(ITickSource):
         >>> print(f"Current tick: {tick}")
     """
 
-    def __init__(self, start_tick: int = 0, tick_rate: int = 64):
+    def __init__(
+        self,
+        start_tick: int = 0,
+        tick_rate: int = 64,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """Initialize mock tick source.
 
         Args:
             start_tick: Starting tick number (default: 0)
             tick_rate: Ticks per second, matching server tickrate (default: 64)
+            clock: Time source in seconds (default: time.monotonic). Tests
+                   can pass a virtual clock to advance ticks without sleeping.
         """
         self.start_tick = start_tick
         self.tick_rate = tick_rate
+        self.clock = clock
         self.start_time: float = 0.0
+        self._advanced_ticks: int = 0
         self._connected: bool = False
 
     async def connect(self) -> bool:
         """Establish mock connection and start timer.
 
-        Records the current system time as the reference point for
+        Records the current clock reading as the reference point for
         tick calculations.
 
         Returns:
             bool: Always returns True for mock connection
         """
-        self.start_time = time.time()
+        self.start_time = self.clock()
         self._connected = True
         return True
 
@@ -68,6 +79,7 @@ class MockTickSource(ITickSource):
         """
         self._connected = False
         self.start_time = 0.0
+        self._advanced_ticks = 0
 
     def is_connected(self) -> bool:
         """Check if mock connection is active.
@@ -84,7 +96,7 @@ class MockTickSource(ITickSource):
         connection and multiplying by tick rate.
 
         Formula:
-            current_tick = start_tick + (elapsed_seconds * tick_rate)
+            current_tick = start_tick + (elapsed_seconds * tick_rate) + advanced ticks
 
         Returns:
             int: Current tick number
@@ -100,6 +112,17 @@ class MockTickSource(ITickSource):
         if not self._connected:
             raise ConnectionError("Not connected to mock tick source")
 
-        elapsed_time = time.time() - self.start_time
+        elapsed_time = self.clock() - self.start_time
         ticks_elapsed = int(elapsed_time * self.tick_rate)
-        return self.start_tick + ticks_elapsed
+        return self.start_tick + ticks_elapsed + self._advanced_ticks
+
+    def advance(self, delta_ticks: int = 1) -> None:
+        """Step the reported tick forward without waiting.
+
+        Lets tests simulate playback deterministically instead of sleeping.
+        Reset on disconnect.
+
+        Args:
+            delta_ticks: Number of ticks to advance (default: 1)
+        """
+        self._advanced_ticks += delta_ticks
@@ -7,8 +7,12 @@ or when the user switches to a different demo.
 import re
 from pathlib import Path
 from typing import Optional, Callable, Awaitable
+from .line_scanner import ConsoleLineScanner
 from .telnet_client import CS2TelnetClient
 
+# Console strings that start a demo load message
+_DEMO_TRIGGERS = ("Playing demo from", "Demo contents for")
+
 
 class DemoMonitor:
     """Monitors CS2 for demo load events.
@@ -26,6 +30,9 @@ class DemoMonitor:
     DEMO_LOAD_PATTERN = re.compile(r"Playing demo from (.+\.dem)")
     DEMO_INFO_PATTERN = re.compile(r"Demo contents for (.+\.dem):")
 
+    # Cap on distinct console path strings kept in _path_cache
+    MAX_CACHED_PATHS = 256
+
     def __init__(self, telnet_client: CS2TelnetClient, cs2_dir: Optional[Path] = None):
         """Initialize demo monitor.
 
@@ -37,6 +44,10 @@ class DemoMonitor:
         self.cs2_dir = Path(cs2_dir) if cs2_dir else None
         self.current_demo: Optional[Path] = None
         self.on_demo_loaded: Optional[Callable[[Path], Awaitable[None]]] = None
+        self._scanner = ConsoleLineScanner(_DEMO_TRIGGERS)
+        # Console path string -> resolved Path, so a repeated load message
+        # yields the same Path object as last time
+        self._path_cache: dict[str, Path] = {}
 
     async def update(self) -> None:
         """Check for demo load events in telnet buffer."""
@@ -129,8 +140,7 @@ class DemoMonitor:
                     # Read available data (non-blocking)
                     data = await self.telnet_client.reader.read(4096)
                     if data:
-                        console_output = data.decode('utf-8', errors='ignore')
-                        demo_path = self._extract_demo_path(console_output)
+                        demo_path = self._scan_new_lines(data)
 
                         if demo_path:
                             # Parse the demo path
@@ -143,11 +153,50 @@ class DemoMonitor:
 
             await asyncio.sleep(poll_interval)
 
+    def _scan_new_lines(self, data: bytes) -> Optional[Path]:
+        """Scan newly read bytes for a demo load message.
+
+        Only complete lines are scanned; a trailing partial line is held by
+        the ConsoleLineScanner until a later read completes it.
+
+        Args:
+            data: Bytes returned by the latest reader.read()
+
+        Returns:
+            Demo path from the last matching line, or None
+        """
+        complete = self._scanner.feed(data)
+        if complete is None:
+            return None
+        return self._find_demo_path(complete)
+
+    def _find_demo_path(self, text: str) -> Optional[Path]:
+        """Find the last demo load message in complete console lines.
+
+        Only the lines containing a trigger string are run through the
+        regexes.
+
+        Args:
+            text: Complete console lines
+
+        Returns:
+            Demo path from the last matching line, or None
+        """
+        for line in reversed(self._scanner.trigger_lines(text)):
+            demo_path = self._extract_demo_path(line)
+            if demo_path:
+                return demo_path
+
+        return None
+
     def _parse_demo_path(self, demo_path_str: str) -> Optional[Path]:
         """Parse demo path from console output.
 
-        Handles both relative and absolute paths. Relative paths are resolved
-        against cs2_dir if provided.
+        Handles both relative and absolute paths. Relative paths are joined
+        onto cs2_dir if provided. The path is built lexically; nothing is
+        stat()ed or resolve()d, since this runs on the console polling path.
+        Results are cached per string, so the same demo always maps to the
+        same Path object and can be compared with ``is``.
 
         Args:
             demo_path_str: Demo path string from console
@@ -155,16 +204,23 @@ class DemoMonitor:
         Returns:
             Resolved Path to demo file, or None if cannot be resolved
         """
+        cached = self._path_cache.get(demo_path_str)
+        if cached is not None:
+            return cached
+
         demo_path = Path(demo_path_str)
 
         # If absolute path, return as-is
         if demo_path.is_absolute():
-            return demo_path if demo_path.exists() else demo_path
-
+            resolved = demo_path
         # If relative path and we have cs2_dir, resolve against it
-        if self.cs2_dir:
+        elif self.cs2_dir:
             resolved = self.cs2_dir / demo_path
-            return resolved
-
         # Otherwise return the path as-is
-        return demo_path
+        else:
+            resolved = demo_path
+
+        if len(self._path_cache) >= self.MAX_CACHED_PATHS:
+            self._path_cache.clear()
+        self._path_cache[demo_path_str] = resolved
+        return resolved
@@ -0,0 +1,113 @@
+"""Incremental scanning of CS2 console output for trigger lines.
+
+DemoMonitor and SpectatorTracker poll the telnet reader and look for a few
+fixed console strings ("Playing demo from", "Spectating", ...). This module
+holds the part they share: buffering reads into complete lines and finding
+the lines that contain a trigger string.
+"""
+
+import functools
+from typing import List, Optional, Tuple
+
+# Optional pyahocorasick support (one C-level scan for all trigger strings)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=None)
+def _trigger_automaton(triggers: Tuple[str, ...]):
+    """Build (once per trigger tuple) an Aho-Corasick automaton for triggers."""
+    automaton = ahocorasick.Automaton()
+    for trigger in triggers:
+        automaton.add_word(trigger, trigger)
+    automaton.make_automaton()
+    return automaton
+
+
+class ConsoleLineScanner:
+    """Splits console reads into complete lines and finds trigger lines.
+
+    Reads from the telnet socket end wherever the 4096-byte read happened to
+    stop, often in the middle of a line. feed() only hands back complete
+    lines: an unterminated last line is held back until a later read brings
+    its newline, so a message split across two reads is seen once, whole,
+    and each poll costs O(new bytes) rather than O(console history).
+
+    Attributes:
+        triggers: Strings that mark an interesting console line
+        MAX_PENDING_BYTES: Cap on a held-back unterminated line; longer
+                           partial lines are dropped
+
+    Example:
+        >>> scanner = ConsoleLineScanner(("Spectating",))
+        >>> scanner.feed(b"noise\\nSpectating: s1")
+        'noise'
+        >>> scanner.feed(b"mple\\n")
+        'Spectating: s1mple'
+    """
+
+    MAX_PENDING_BYTES = 64 * 1024
+
+    def __init__(self, triggers: Tuple[str, ...]):
+        """Initialize scanner.
+
+        Args:
+            triggers: Strings that mark an interesting console line
+        """
+        self.triggers = tuple(triggers)
+        self._pending = bytearray()  # Trailing partial line from the last read
+
+    def feed(self, data: bytes) -> Optional[str]:
+        """Add newly read bytes and return the lines they complete.
+
+        Args:
+            data: Bytes returned by the latest reader.read()
+
+        Returns:
+            Newly completed lines (without the final newline), or None if
+            data did not complete a line
+        """
+        pending = self._pending
+        pending += data
+        end = pending.rfind(b"\n")
+        if end < 0:
+            if len(pending) > self.MAX_PENDING_BYTES:
+                pending.clear()
+            return None
+
+        complete = pending[:end].decode('utf-8', errors='ignore')
+        del pending[:end + 1]
+        return complete
+
+    def trigger_lines(self, text: str) -> List[str]:
+        """Find the lines of text that contain a trigger string.
+
+        With pyahocorasick installed the triggers are located in a single
+        pass over the text; otherwise each line is checked with substring
+        tests.
+
+        Args:
+            text: Complete console lines
+
+        Returns:
+            Matching lines in order, each listed once
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return [
+                line for line in text.split("\n")
+                if any(trigger in line for trigger in self.triggers)
+            ]
+
+        lines = []
+        last_line_start = -1
+        for end_index, _ in _trigger_automaton(self.triggers).iter(text):
+            line_start = text.rfind("\n", 0, end_index) + 1
+            if line_start == last_line_start:
+                continue
+            last_line_start = line_start
+            line_end = text.find("\n", end_index)
+            lines.append(text[line_start:line_end if line_end >= 0 else None])
+        return lines
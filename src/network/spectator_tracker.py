@@ -5,9 +5,15 @@ is currently spectating during demo playback.
 """
 
 import re
+import sys
+from collections import deque
 from typing import Optional, Callable, Awaitable, Tuple
+from .line_scanner import ConsoleLineScanner
 from .telnet_client import CS2TelnetClient
 
+# Console strings that mark a spectator line ("Spectating:" / "spectating")
+_SPECTATOR_TRIGGERS = ("Spectating", "spectating")
+
 
 class SpectatorTracker:
     """Tracks which player is currently being spectated.
@@ -27,6 +33,14 @@ class SpectatorTracker:
     # "Now spectating: PlayerName (STEAM_1:0:123456)"
     SPECTATOR_PATTERN = re.compile(r"[Ss]pectating:?\s+(.+?)(?:\s+\(([^)]+)\))?$")
 
+    # Single-pass pattern for 'status' output: either a player list row
+    # (userid "name" uniqueid connected ping) or a spectator line
+    STATUS_PATTERN = re.compile(
+        r'^\s*\d+\s+"(?P<name>[^"]+)"\s+(?P<steam_id>STEAM_[\d:]+)'
+        r'|[Ss]pectating:?[ \t]+(?P<target>.+?)(?:[ \t]+\([^)]+\))?[ \t]*$',
+        re.MULTILINE
+    )
+
     def __init__(self, telnet_client: CS2TelnetClient):
         """Initialize spectator tracker.
 
@@ -36,6 +50,8 @@ class SpectatorTracker:
         self.telnet_client = telnet_client
         self.current_player: Optional[Tuple[str, str]] = None  # (name, steam_id)
         self.on_spectator_changed: Optional[Callable[[str, str], Awaitable[None]]] = None
+        self._scanner = ConsoleLineScanner(_SPECTATOR_TRIGGERS)
+        self._last_target: Optional[str] = None  # Last target reported by track_spectator_changes
 
     async def update(self) -> None:
         """Check for spectator change events in telnet buffer."""
@@ -111,6 +127,7 @@ class SpectatorTracker:
     def clear_current(self) -> None:
         """Clear the current spectator state."""
         self.current_player = None
+        self._last_target = None
 
     async def get_current_target(self) -> Optional[str]:
         """Get the current spectator target player name.
@@ -135,15 +152,29 @@ class SpectatorTracker:
 
         return None
 
-    async def track_spectator_changes(self, callback: Callable[[str], Awaitable[None]], poll_interval: float = 1.0):
+    async def track_spectator_changes(
+        self,
+        callback: Callable[[str], Awaitable[None]],
+        poll_interval: float = 1.0,
+        stable_reads: int = 1
+    ):
         """Track spectator target changes continuously.
 
         Args:
             callback: Async function called when spectator target changes (receives player name)
             poll_interval: Polling interval in seconds (default: 1.0)
+            stable_reads: Number of consecutive reads that must report the same
+                          target before it is reported (default: 1). Values
+                          above 1 suppress targets that flap between reads.
+
+        Raises:
+            ValueError: If stable_reads is less than 1
         """
         import asyncio
-        last_target = None
+
+        if stable_reads < 1:
+            raise ValueError(f"stable_reads must be at least 1, got {stable_reads}")
+        recent_targets: deque = deque(maxlen=stable_reads)
 
         while True:
             try:
@@ -151,17 +182,91 @@ class SpectatorTracker:
                 if hasattr(self.telnet_client, 'reader') and self.telnet_client.reader:
                     data = await self.telnet_client.reader.read(4096)
                     if data:
-                        console_output = data.decode('utf-8', errors='ignore')
-                        current_target = self._parse_status_output(console_output)
+                        current_target = self._scan_new_lines(data)
 
-                        if current_target and current_target != last_target:
-                            last_target = current_target
+                        if current_target and self._is_new_stable_target(current_target, recent_targets):
+                            self._last_target = current_target
                             await callback(current_target)
             except Exception:
                 pass
 
             await asyncio.sleep(poll_interval)
 
+    def _is_new_stable_target(self, target: str, recent_targets: deque) -> bool:
+        """Record a read target and check whether it should be reported.
+
+        Args:
+            target: Spectator target from the latest read
+            recent_targets: Ring buffer of the last stable_reads targets
+
+        Returns:
+            True if the target differs from the last reported one and fills
+            the whole ring buffer
+        """
+        recent_targets.append(target)
+        if target == self._last_target or len(recent_targets) < recent_targets.maxlen:
+            return False
+        return recent_targets.count(target) == recent_targets.maxlen
+
+    def _scan_new_lines(self, data: bytes) -> Optional[str]:
+        """Scan newly read bytes for a spectator target.
+
+        Only complete lines are parsed; a trailing partial line is held by
+        the ConsoleLineScanner until a later read completes it.
+
+        Args:
+            data: Bytes returned by the latest reader.read()
+
+        Returns:
+            Spectated player name from the new lines, or None
+        """
+        complete = self._scanner.feed(data)
+        if complete is None:
+            return None
+        return self._find_target(complete)
+
+    def _find_target(self, text: str) -> Optional[str]:
+        """Find the last spectator target in complete console lines.
+
+        Only the lines containing a trigger string are run through the
+        regex.
+
+        Args:
+            text: Complete console lines
+
+        Returns:
+            Spectated player name, or None if no spectator line is present
+        """
+        for line in reversed(self._scanner.trigger_lines(text)):
+            target = self._parse_status_output(line)
+            if target:
+                return target
+
+        return None
+
+    def _parse_status(self, status_text: str) -> Tuple[dict, Optional[str]]:
+        """Parse player list and spectator target from status output in one scan.
+
+        Args:
+            status_text: Output from 'status' console command
+
+        Returns:
+            Tuple of (player name -> Steam ID mapping, spectated player name
+            or None). If several spectator lines are present, the last one wins.
+            Names and Steam IDs are interned, since the same few strings
+            come back on every status poll and are compared on dispatch.
+        """
+        player_mapping = {}
+        target = None
+
+        for match in self.STATUS_PATTERN.finditer(status_text):
+            if match.group('name') is not None:
+                player_mapping[sys.intern(match.group('name'))] = sys.intern(match.group('steam_id'))
+            else:
+                target = sys.intern(match.group('target').strip())
+
+        return player_mapping, target
+
     def _parse_status_output(self, status_text: str) -> Optional[str]:
         """Parse status command output to extract spectator target.
 
@@ -171,12 +276,7 @@ class SpectatorTracker:
         Returns:
             Player name being spectated, or None if not spectating
         """
-        # Look for "Spectating: PlayerName" pattern
-        match = self.SPECTATOR_PATTERN.search(status_text)
-        if match:
-            return match.group(1).strip()
-
-        return None
+        return self._parse_status(status_text)[1]
 
     def _build_player_mapping(self, status_text: str) -> dict:
         """Build mapping of player names to Steam IDs from status output.
@@ -187,15 +287,4 @@ class SpectatorTracker:
         Returns:
             Dictionary mapping player names to Steam IDs
         """
-        player_mapping = {}
-
-        # Parse player list from status output
-        # Format: userid "name" uniqueid connected ping
-        player_pattern = re.compile(r'^\s*\d+\s+"([^"]+)"\s+(STEAM_[\d:]+)', re.MULTILINE)
-
-        for match in player_pattern.finditer(status_text):
-            player_name = match.group(1)
-            steam_id = match.group(2)
-            player_mapping[player_name] = steam_id
-
-        return player_mapping
+        return self._parse_status(status_text)[0]
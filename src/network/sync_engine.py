@@ -11,7 +11,7 @@ prediction of the current tick between polling intervals.
 
 import asyncio
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 from ..interfaces.tick_source import ITickSource
 
@@ -30,13 +30,15 @@ class SyncEngine:
         tick_source: Source of tick information (e.g., telnet client)
         polling_interval: How often to poll in seconds (default: 0.25)
         tick_rate: Game tick rate in Hz (default: 64 for CS2)
+        clock: Time source in seconds (default: time.monotonic)
     """
 
     def __init__(
         self,
         tick_source: ITickSource,
         polling_interval: float = 0.25,
-        tick_rate: int = 64
+        tick_rate: int = 64,
+        clock: Callable[[], float] = time.monotonic
     ):
         """Initialize the sync engine.
 
@@ -44,10 +46,15 @@ class SyncEngine:
             tick_source: Source of tick information (Telnet client)
             polling_interval: How often to poll in seconds (default: 250ms)
             tick_rate: Game tick rate in Hz (default: 64 for CS2)
+            clock: Time source in seconds (default: time.monotonic, so
+                   prediction is not thrown off by wall-clock adjustments).
+                   Tests can pass a virtual clock to drive prediction
+                   without sleeping.
         """
         self.tick_source = tick_source
         self.polling_interval = polling_interval
         self.tick_rate = tick_rate
+        self.clock = clock
 
         # Calculated constants
         self.tick_duration = 1.0 / self.tick_rate  # 15.625 ms per tick
@@ -108,7 +115,7 @@ class SyncEngine:
         """
         try:
             server_tick = await self.tick_source.get_current_tick()
-            current_time = time.time()
+            current_time = self.clock()
 
             # Update sync state
             self._last_synced_tick = server_tick
@@ -129,7 +136,8 @@ class SyncEngine:
         """Get the timestamp of the last successful sync.
 
         Returns:
-            float: Unix timestamp of last sync
+            float: Clock reading of last sync (time.monotonic() seconds by
+                   default, not a Unix timestamp)
         """
         return self._last_sync_time
 
@@ -147,7 +155,7 @@ class SyncEngine:
             return 0
 
         # Time elapsed since last sync
-        time_elapsed = time.time() - self._last_sync_time
+        time_elapsed = self.clock() - self._last_sync_time
 
         # Calculate ticks elapsed based on tick rate
         ticks_elapsed = int(time_elapsed / self.tick_duration)
@@ -170,7 +178,7 @@ class SyncEngine:
         if self._last_sync_time == 0:
             return 0.0
 
-        return time.time() - self._last_sync_time
+        return self.clock() - self._last_sync_time
 
     def is_running(self) -> bool:
         """Check if the sync engine is running.
@@ -272,7 +280,8 @@ class SafeSyncEngine(SyncEngine):
         tick_rate: int = 64,
         query_timeout: float = 2.0,
         min_valid_tick: int = 0,
-        max_valid_tick: int = 1_000_000
+        max_valid_tick: int = 1_000_000,
+        clock: Callable[[], float] = time.monotonic
     ):
         """Initialize the safe sync engine.
 
@@ -283,8 +292,9 @@ class SafeSyncEngine(SyncEngine):
             query_timeout: Timeout for tick queries in seconds (default: 2.0)
             min_valid_tick: Minimum valid tick value (default: 0)
             max_valid_tick: Maximum valid tick value (default: 1,000,000)
+            clock: Time source in seconds (default: time.monotonic)
         """
-        super().__init__(tick_source, polling_interval, tick_rate)
+        super().__init__(tick_source, polling_interval, tick_rate, clock)
         self.query_timeout = query_timeout
         self.min_valid_tick = min_valid_tick
         self.max_valid_tick = max_valid_tick
@@ -308,7 +318,7 @@ class SafeSyncEngine(SyncEngine):
                 return
 
             # Update state
-            current_time = time.time()
+            current_time = self.clock()
             self._last_synced_tick = server_tick
             self._last_sync_time = current_time
 
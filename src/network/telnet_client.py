@@ -8,11 +8,30 @@ The client connects to CS2's netcon port (default: 2121) and uses the
 """
 
 import asyncio
+import logging
 import re
 from typing import Optional
 
 from ..interfaces.tick_source import ITickSource
 
+logger = logging.getLogger(__name__)
+
+
+if hasattr(asyncio, "timeout"):
+    async def _read_with_timeout(reader: asyncio.StreamReader, n: int, timeout: float) -> bytes:
+        """Read up to n bytes, raising asyncio.TimeoutError after timeout seconds.
+
+        Uses asyncio.timeout() (Python 3.11+), which cancels the read in place.
+        asyncio.wait_for() would wrap every read in a new Task, copying the
+        current contextvars context each time the tick is polled.
+        """
+        async with asyncio.timeout(timeout):
+            return await reader.read(n)
+else:
+    async def _read_with_timeout(reader: asyncio.StreamReader, n: int, timeout: float) -> bytes:
+        """Read up to n bytes, raising asyncio.TimeoutError after timeout seconds."""
+        return await asyncio.wait_for(reader.read(n), timeout=timeout)
+
 
 class CS2TelnetClient(ITickSource):
     """Async telnet client for CS2 network console.
@@ -234,24 +253,16 @@ class CS2TelnetClient(ITickSource):
             int: Current tick from demo file (0 if not playing or error)
         """
         if not self._connected:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.debug("[Telnet] Not connected, cannot get tick via marktick")
             return self._current_tick
 
         try:
-            import logging
-            logger = logging.getLogger(__name__)
-
             # Send demo_marktick command
             self.writer.write(b"demo_marktick\n")
             await self.writer.drain()
 
             # Read response with timeout
-            response = await asyncio.wait_for(
-                self.reader.read(1024),
-                timeout=1.0
-            )
+            response = await _read_with_timeout(self.reader, 1024, 1.0)
 
             response_text = response.decode('utf-8', errors='ignore')
             logger.debug(f"[Telnet] demo_marktick response: {repr(response_text)}")
@@ -273,13 +284,9 @@ class CS2TelnetClient(ITickSource):
                 return self._current_tick
 
         except asyncio.TimeoutError:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning("[Telnet] Timeout reading demo_marktick response")
             return self._current_tick
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"[Telnet] Error getting tick via marktick: {e}", exc_info=True)
             return self._current_tick
 
@@ -312,10 +319,7 @@ class CS2TelnetClient(ITickSource):
             await self.writer.drain()
 
             # Read response with timeout
-            response = await asyncio.wait_for(
-                self.reader.read(2048),
-                timeout=1.0
-            )
+            response = await _read_with_timeout(self.reader, 2048, 1.0)
 
             response_text = response.decode('utf-8', errors='ignore')
 
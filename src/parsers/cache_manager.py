@@ -46,6 +46,13 @@ try:
 except ImportError:
     MSGPACK_AVAILABLE = False
 
+# Optional orjson support (faster JSON encoding/decoding)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -265,6 +272,14 @@ class CacheManager:
             cache_data: Cache dictionary
             output_path: Destination path
         """
+        if ORJSON_AVAILABLE:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    cache_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+            return
+
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(cache_data, f, indent=2, ensure_ascii=False)
 
@@ -281,9 +296,12 @@ class CacheManager:
             CacheFormatError: If JSON is invalid
         """
         try:
+            if ORJSON_AVAILABLE:
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(cache_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             raise CacheFormatError(f"Invalid JSON format: {e}") from e
 
     def _save_msgpack(self, cache_data: Dict[str, Any], output_path: str):
@@ -353,28 +371,28 @@ class CacheManager:
         # Sort ticks numerically
         sorted_ticks = sorted(cache["inputs"].items(), key=lambda x: int(x[0]))
 
+        dedup = remove_duplicates and sparse_storage
+        optimized_inputs = optimized["inputs"]
+        clean = self._clean_tick_data
         prev_state = None
-        kept_ticks = 0
-        removed_ticks = 0
+        prev_raw = None
 
         for tick_str, tick_data in sorted_ticks:
-            # Create state signature for comparison
-            current_state = self._create_state_signature(tick_data)
-
-            # Check if we should keep this tick
-            should_keep = True
-
-            if remove_duplicates and sparse_storage:
+            if dedup:
+                # Consecutive duplicates usually repeat the exact same lists,
+                # so compare those before building the (sorted) signature
+                raw = (tick_data.get("keys", []), tick_data.get("mouse", []))
+                if raw == prev_raw:
+                    continue
+                prev_raw = raw
+
+                current_state = self._create_state_signature(tick_data)
                 if current_state == prev_state:
-                    should_keep = False
-                    removed_ticks += 1
-
-            if should_keep:
-                # Clean up tick data
-                cleaned_data = self._clean_tick_data(tick_data)
-                optimized["inputs"][tick_str] = cleaned_data
+                    continue
                 prev_state = current_state
-                kept_ticks += 1
+
+            # Clean up tick data
+            optimized_inputs[tick_str] = clean(tick_data)
 
         original_size = len(cache["inputs"])
         optimized_size = len(optimized["inputs"])
@@ -416,12 +434,13 @@ class CacheManager:
         }
 
         # Only include subtick data for active keys
-        subtick = tick_data.get("subtick", {})
-        all_active_keys = set(cleaned["keys"]) | set(cleaned["mouse"])
-
-        for key in all_active_keys:
-            if key in subtick:
-                cleaned["subtick"][key] = subtick[key]
+        subtick = tick_data.get("subtick")
+        if subtick:
+            active_keys = set(cleaned["keys"])
+            active_keys.update(cleaned["mouse"])
+            cleaned["subtick"] = {
+                key: value for key, value in subtick.items() if key in active_keys
+            }
 
         return cleaned
 
@@ -5,19 +5,37 @@ if cached data is up-to-date without reading entire demo files. Used by Phase 6
 Auto Mode to efficiently skip re-processing unchanged demo files.
 
 Cache Validation Strategy:
-    - Compute hash of first 10MB + file size (not full file MD5)
-    - Store hash in cache/{demo_name}.md5
-    - Compare stored hash with current hash to validate cache
+    - Compute hash of three 4KB samples (head, middle, tail) + file size
+      (not a full file hash)
+    - Store hash together with the demo's size and mtime in the SQLite
+      index cache/index.sqlite (one indexed row per demo path)
+    - If size and mtime are unchanged, the cache is valid without hashing
+    - Otherwise compare stored hash with current hash to validate cache
     - Much faster than full file hashing for large demo files
 
+Hash File Format (JSON, legacy):
+    {"size": 524288000, "mtime_ns": 1700000000000000000,
+     "saved_ns": 1700000100000000000, "content_hash": "524288000_a1b2..."}
+
+    Older versions stored hashes in these per-demo files. They are still
+    read for demos that have no row in the index yet (migration fallback),
+    and replaced by an index row when the demo's hash is next saved. Hash
+    files containing only the bare hash string (oldest format) are
+    accepted too; they just always take the hashing path. New hash files
+    are only written when the index cannot be opened.
+
 Hash Format:
-    "{file_size_bytes}_{md5_of_first_10mb}"
+    "{file_size_bytes}_{128_bit_hash_of_sampled_windows}"
+    The hash is XXH3-128 when the optional xxhash package is installed and
+    BLAKE2b-128 otherwise. Switching between them just invalidates the cache
+    once.
     Example: "524288000_a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6"
 
 File Structure:
     cache/
     ├── demo_name.json      # Cache data (managed by CacheManager)
-    └── demo_name.md5       # Hash for validation (managed by CacheValidator)
+    ├── demo_name.md5       # Hash for validation (legacy, read-only fallback)
+    └── index.sqlite        # Hash index for validation (managed by CacheValidator)
 
 Example:
     >>> validator = CacheValidator(Path("cache"))
@@ -33,16 +51,74 @@ Example:
     ...     validator.save_hash(demo_path)
 """
 
+import asyncio
+import concurrent.futures
+import functools
 import hashlib
+import json
 import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
+
+# Optional xxhash support (faster non-cryptographic content hash)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _new_content_hash():
+    """Create the 128-bit hasher used for demo fingerprints."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    # digest_size=16 keeps the 32-hex-digit format of the old MD5 hash
+    return hashlib.blake2b(digest_size=16)
+
+
+def _update_windows(content_hash, f, offsets, size: int) -> None:
+    """Feed size-byte windows of an open file at offsets into content_hash.
+
+    The file is memory-mapped so each window reaches the hasher as a
+    zero-copy slice. Files that cannot be mapped (some network shares and
+    special files) are read window by window into one reused buffer instead.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        buffer = bytearray(size)
+        with memoryview(buffer) as view:
+            for offset in offsets:
+                f.seek(offset)
+                content_hash.update(view[:f.readinto(buffer)])
+        return
+
+    with mm, memoryview(mm) as view:
+        for offset in offsets:
+            content_hash.update(view[offset:offset + size])
+
+
+@functools.lru_cache(maxsize=256)
+def _cache_path_for(cache_dir: str, demo_path: str) -> Path:
+    """Cache file path for a demo, memoized on (cache_dir, demo_path) strings."""
+    return Path(cache_dir) / (Path(demo_path).name + ".json")
+
+
+@functools.lru_cache(maxsize=256)
+def _hash_path_for(cache_dir: str, demo_path: str) -> Path:
+    """Hash file path for a demo, memoized on (cache_dir, demo_path) strings."""
+    return Path(cache_dir) / (Path(demo_path).stem + ".md5")
+
+
 class CacheValidationError(Exception):
     """Base exception for cache validation errors."""
     pass
@@ -56,24 +132,42 @@ class DemoFileNotFoundError(CacheValidationError):
 class CacheValidator:
     """Fast cache validator using partial file hashing.
 
-    Validates cache freshness by comparing a fast hash (first 10MB + file size)
-    instead of hashing the entire demo file. Dramatically improves performance
-    for large demo files (100MB+) while still detecting file changes.
+    Validates cache freshness by comparing a fast hash (head, middle and tail
+    samples + file size) instead of hashing the entire demo file. The cost is
+    constant in the demo size while still detecting re-recorded, truncated or
+    appended demos.
+
+    Stored hashes live in a SQLite index (INDEX_NAME in cache_dir). The
+    .md5 hash files of older versions are only read, for demos without an
+    index row, and are removed once the demo's hash is saved to the index.
+    If the index cannot be opened (or the validator is closed), hashes are
+    read from and written to hash files instead.
+
+    The index connection stays open for the validator's lifetime; call
+    close() (or use the validator as a context manager) when done, which
+    also checkpoints the write-ahead log so no -wal/-shm files are left
+    behind.
 
     Attributes:
         cache_dir: Directory where cache files and hash files are stored
-        CHUNK_SIZE: Size of chunks for reading files (1MB)
-        MAX_HASH_SIZE: Maximum bytes to hash from file (10MB)
+        CHUNK_SIZE: Read size when streaming a whole file through a hash (4MB)
+        SAMPLE_SIZE: Size of each sampled window (4KB)
 
     Performance:
-        - Hashing 10MB: ~50ms
-        - Hashing 500MB: ~2500ms
-        - Speedup: 50x faster for large files
+        - Reads at most 12KB per demo, regardless of demo size
     """
 
     # Constants for hash computation
-    CHUNK_SIZE = 1024 * 1024  # 1MB chunks for efficient reading
-    MAX_HASH_SIZE = 10 * 1024 * 1024  # Hash first 10MB only
+    CHUNK_SIZE = 4 * 1024 * 1024  # 4MB reads for full-file hashing
+    SAMPLE_SIZE = 4096  # Hash three 4KB windows: head, middle, tail
+    # A demo modified this close to save_hash() may share its mtime with
+    # a later write (coarse filesystem timestamps), so its fingerprint
+    # is not trusted and validation falls back to hashing.
+    FINGERPRINT_MIN_AGE_NS = 2 * 1000 * 1000 * 1000  # 2 seconds
+    # Demos hashed at once by warm_cache_async() and hash_many()
+    WARM_CONCURRENCY = 32
+    # SQLite hash index in cache_dir
+    INDEX_NAME = "index.sqlite"
 
     def __init__(self, cache_dir: Path):
         """Initialize cache validator with specified cache directory.
@@ -89,22 +183,59 @@ class CacheValidator:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Demo path -> fingerprint dict (same shape as a hash file) of the
+        # last hash computed, so an unchanged demo is not hashed twice
+        self._hash_memo: dict[str, dict] = {}
+        # Shared by the worker threads of is_cache_valid_async()
+        self._db_lock = threading.Lock()
+        self._db = self._open_index()
         logger.debug(f"CacheValidator initialized with cache_dir: {self.cache_dir}")
 
-    def get_demo_hash(self, demo_path: Path) -> str:
-        """Compute fast hash of demo file (first 10MB + file size).
+    def close(self) -> None:
+        """Checkpoint and close the hash index connection.
+
+        The write-ahead log is folded into the index first, so the -wal and
+        -shm files are removed. Safe to call more than once. Afterwards the
+        validator keeps working from hash files only.
+        """
+        with self._db_lock:
+            db, self._db = self._db, None
+        if db is not None:
+            try:
+                db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"Could not checkpoint hash index: {e}")
+            db.close()
+
+    def __enter__(self) -> "CacheValidator":
+        """Return the validator itself for use in a with block."""
+        return self
 
-        Uses MD5 hash of the first 10MB of the file combined with total file size.
-        This provides a good balance between speed and change detection:
-        - Fast: Only reads first 10MB regardless of file size
-        - Reliable: File size change or header modification triggers rehash
-        - Efficient: Uses chunked reading to avoid memory issues
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Close the hash index on leaving the with block."""
+        self.close()
+
+    def get_demo_hash(self, demo_path: Path) -> str:
+        """Compute fast hash of demo file (sampled windows + file size).
+
+        Uses a 128-bit hash (XXH3 if xxhash is installed, else BLAKE2b) of the
+        file size and three SAMPLE_SIZE windows: the start, the 4KB-aligned
+        middle and the end of the file. Files of up to three windows are
+        hashed whole. This provides a good balance between speed and change
+        detection:
+        - Fast: Reads at most 12KB regardless of file size
+        - Reliable: Any size change, and any change to the header, middle or
+          end of the demo (where a re-recording differs), triggers rehash
+        - Efficient: The file is memory-mapped and the windows are handed to
+          the hasher as slices, so no read buffers are allocated
+        - Memoized: The result is reused while the demo's size and mtime
+          are unchanged (same trust rule as the stored fingerprint)
 
         Args:
             demo_path: Path to demo file (.dem)
 
         Returns:
-            Hash string in format "{size_bytes}_{md5_hash}"
+            Hash string in format "{size_bytes}_{hash_hex}" (32 hex digits)
             Example: "524288000_a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6"
 
         Raises:
@@ -131,34 +262,44 @@ class CacheValidator:
             )
 
         try:
-            # Get file size
-            file_size = demo_path.stat().st_size
-
-            # Compute MD5 of first 10MB (or entire file if smaller)
-            md5_hash = hashlib.md5()
-            bytes_read = 0
-
-            with open(demo_path, 'rb') as f:
-                while bytes_read < self.MAX_HASH_SIZE:
-                    # Read chunk (don't exceed MAX_HASH_SIZE)
-                    chunk_size = min(
-                        self.CHUNK_SIZE,
-                        self.MAX_HASH_SIZE - bytes_read
-                    )
-                    chunk = f.read(chunk_size)
+            demo_stat = demo_path.stat()
+            memo_key = str(demo_path)
+            memo = self._hash_memo.get(memo_key)
+            if memo is not None and self._fingerprint_matches(memo, demo_stat):
+                return memo["content_hash"]
+
+            file_size = demo_stat.st_size
+
+            content_hash = _new_content_hash()
+            content_hash.update(file_size.to_bytes(8, 'little'))
+            sample = self.SAMPLE_SIZE
+
+            if file_size <= 3 * sample:
+                # Small file: hash everything
+                offsets = (0,) if file_size else ()
+                sample = file_size
+            else:
+                offsets = (0, (file_size // 2) & ~(sample - 1), file_size - sample)
 
-                    if not chunk:
-                        break  # EOF reached
+            # mmap cannot map an empty file; the empty digest is correct there
+            if offsets:
+                with open(demo_path, 'rb') as f:
+                    _update_windows(content_hash, f, offsets, sample)
+            bytes_read = len(offsets) * sample
 
-                    md5_hash.update(chunk)
-                    bytes_read += len(chunk)
+            # Create hash string: size_hash
+            hash_string = f"{file_size}_{content_hash.hexdigest()}"
 
-            # Create hash string: size_md5
-            hash_string = f"{file_size}_{md5_hash.hexdigest()}"
+            self._hash_memo[memo_key] = {
+                "size": file_size,
+                "mtime_ns": demo_stat.st_mtime_ns,
+                "saved_ns": time.time_ns(),
+                "content_hash": hash_string,
+            }
 
             logger.debug(
                 f"Computed hash for {demo_path.name}: {hash_string} "
-                f"(read {bytes_read / (1024*1024):.2f} MB of {file_size / (1024*1024):.2f} MB)"
+                f"(read {bytes_read / 1024:.0f} KB of {file_size / (1024*1024):.2f} MB)"
             )
 
             return hash_string
@@ -177,9 +318,14 @@ class CacheValidator:
 
         Validates cache by:
         1. Checking if cache file exists (.json)
-        2. Checking if hash file exists (.md5)
-        3. Computing current demo file hash
-        4. Comparing current hash with stored hash
+        2. Looking up the stored hash (index row, else legacy .md5 file)
+        3. Comparing demo size and mtime with the stored fingerprint;
+           if they match, the cache is valid without reading the demo
+        4. Otherwise computing current demo file hash and comparing it
+           with the stored hash
+
+        Nothing is written: a stale fingerprint stays stale until
+        save_hash(), warm_cache_async() or hash_many() refreshes it.
 
         Args:
             demo_path: Path to demo file (.dem)
@@ -204,21 +350,24 @@ class CacheValidator:
             ...     validator.save_hash(demo)
         """
         try:
-            # Get paths
+            # Check if cache file exists
             cache_path = self.get_cache_path(demo_path)
-            hash_path = self._get_hash_path(demo_path)
-
-            # Check if both cache and hash files exist
             if not cache_path.exists():
                 logger.debug(f"Cache file missing: {cache_path}")
                 return False
 
-            if not hash_path.exists():
-                logger.debug(f"Hash file missing: {hash_path}")
+            # Read stored hash
+            stored = self._load_stored(demo_path)
+            if stored is None:
+                logger.debug(f"No stored hash for {Path(demo_path).name}")
                 return False
+            stored_hash = stored["content_hash"]
 
-            # Read stored hash
-            stored_hash = hash_path.read_text().strip()
+            # Fast path: unchanged size and mtime means unchanged content
+            demo_stat = Path(demo_path).stat()
+            if self._fingerprint_matches(stored, demo_stat):
+                logger.debug(f"Cache valid for {Path(demo_path).name} (fingerprint match)")
+                return True
 
             # Compute current hash
             current_hash = self.get_demo_hash(demo_path)
@@ -239,18 +388,110 @@ class CacheValidator:
 
             return is_valid
 
-        except DemoFileNotFoundError:
+        except (DemoFileNotFoundError, FileNotFoundError):
             logger.warning(f"Demo file not found: {demo_path}")
             return False
         except Exception as e:
             logger.error(f"Error validating cache for {demo_path}: {e}")
             return False
 
+    async def is_cache_valid_async(self, demo_path: Path) -> bool:
+        """Awaitable is_cache_valid() for use from the event loop.
+
+        Runs the validation (stat, hash file read and, if needed, demo
+        hashing) in a worker thread so the render and monitoring loops keep
+        running while the demo is read.
+
+        Args:
+            demo_path: Path to demo file (.dem)
+
+        Returns:
+            True if cache is valid and up-to-date, False otherwise
+        """
+        return await asyncio.to_thread(self.is_cache_valid, demo_path)
+
+    async def warm_cache_async(self, demo_paths: Iterable[Path]) -> Dict[Path, Optional[str]]:
+        """Hash many demos concurrently, e.g. before a bulk cache rebuild.
+
+        Each demo is hashed in a worker thread with at most WARM_CONCURRENCY
+        in flight, so the sampled-window reads of different files overlap
+        instead of running one after another. Results land in the hash memo,
+        so later is_cache_valid() and save_hash() calls for an unchanged
+        demo do not hash it again. Demos whose stored hash still matches but
+        whose size/mtime fingerprint does not (touched, or saved right after
+        a write) get the fingerprint refreshed, so later is_cache_valid()
+        calls skip hashing.
+
+        Args:
+            demo_paths: Demo files (.dem) to hash
+
+        Returns:
+            Dictionary mapping each demo path to its hash string, or None
+            if the demo could not be hashed
+        """
+        semaphore = asyncio.Semaphore(self.WARM_CONCURRENCY)
+
+        async def hash_one(demo_path: Path) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self._warm_one, demo_path)
+
+        paths = [Path(p) for p in demo_paths]
+        hashes = await asyncio.gather(*(hash_one(p) for p in paths))
+        return dict(zip(paths, hashes))
+
+    def hash_many(self, demo_paths: Iterable[Path]) -> Dict[Path, Optional[str]]:
+        """Hash many demos on a thread pool, for callers without an event loop.
+
+        Synchronous counterpart of warm_cache_async(). The sampled windows
+        reach the hasher as memory-mapped slices, and hashlib/xxhash release
+        the GIL while hashing, so up to WARM_CONCURRENCY files are read and
+        hashed in parallel. Stale fingerprints are refreshed the same way.
+
+        Args:
+            demo_paths: Demo files (.dem) to hash
+
+        Returns:
+            Dictionary mapping each demo path to its hash string, or None
+            if the demo could not be hashed
+        """
+        paths = [Path(p) for p in demo_paths]
+        if not paths:
+            return {}
+
+        workers = min(self.WARM_CONCURRENCY, len(paths))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = list(executor.map(self._warm_one, paths))
+        return dict(zip(paths, hashes))
+
+    def _warm_one(self, demo_path: Path) -> Optional[str]:
+        """Hash a demo for the warm-up paths and refresh its stale fingerprint.
+
+        Args:
+            demo_path: Path to demo file (.dem)
+
+        Returns:
+            Hash string, or None (logged) if the demo could not be hashed
+        """
+        try:
+            # Stat before hashing so a write during hashing changes the mtime
+            demo_stat = Path(demo_path).stat()
+            current_hash = self.get_demo_hash(demo_path)
+        except (OSError, CacheValidationError) as e:
+            logger.warning(f"Skipping cache warm-up for {demo_path}: {e}")
+            return None
+
+        stored = self._load_stored(demo_path)
+        if (stored is not None and stored["content_hash"] == current_hash
+                and not self._fingerprint_matches(stored, demo_stat)):
+            self._store_hash(demo_path, demo_stat, current_hash)
+        return current_hash
+
     def save_hash(self, demo_path: Path) -> bool:
         """Save hash of demo file after successful ETL processing.
 
-        Computes and stores the demo file hash to enable future cache validation.
-        Should be called after successfully generating cache data.
+        Computes and stores the demo file hash, along with the file's size and
+        mtime, to enable future cache validation. Should be called after
+        successfully generating cache data.
 
         Args:
             demo_path: Path to demo file (.dem)
@@ -273,19 +514,16 @@ class CacheValidator:
             True
         """
         try:
+            # Stat before hashing so a write during hashing changes the mtime
+            demo_stat = Path(demo_path).stat()
+
             # Compute current hash
             current_hash = self.get_demo_hash(demo_path)
 
-            # Get hash file path
-            hash_path = self._get_hash_path(demo_path)
+            # Save hash and fingerprint to the index
+            self._store_hash(demo_path, demo_stat, current_hash)
 
-            # Save hash to file
-            hash_path.write_text(current_hash)
-
-            logger.info(
-                f"Saved hash for {demo_path.name}: {current_hash} "
-                f"to {hash_path}"
-            )
+            logger.info(f"Saved hash for {demo_path.name}: {current_hash}")
 
             return True
 
@@ -302,6 +540,9 @@ class CacheValidator:
         - demos/match.dem -> cache/match.dem.json
         - /path/to/demo.dem -> cache/demo.dem.json
 
+        Results are memoized, so repeated calls for the same demo return the
+        same Path object instead of rebuilding it.
+
         Args:
             demo_path: Path to demo file (.dem)
 
@@ -314,9 +555,7 @@ class CacheValidator:
             >>> print(cache_path)
             cache/match.dem.json
         """
-        demo_path = Path(demo_path)
-        cache_filename = demo_path.name + ".json"
-        return self.cache_dir / cache_filename
+        return _cache_path_for(os.fspath(self.cache_dir), os.fspath(demo_path))
 
     def _get_hash_path(self, demo_path: Path) -> Path:
         """Get path to hash file for the given demo file.
@@ -331,21 +570,150 @@ class CacheValidator:
         Returns:
             Path to hash file (.md5) in cache directory
         """
-        demo_path = Path(demo_path)
-        hash_filename = demo_path.stem + ".md5"
-        return self.cache_dir / hash_filename
+        return _hash_path_for(os.fspath(self.cache_dir), os.fspath(demo_path))
+
+    def _read_hash_file(self, hash_path: Path) -> dict:
+        """Read stored hash and fingerprint from a (legacy) hash file.
+
+        Args:
+            hash_path: Path to hash file (.md5)
+
+        Returns:
+            Dictionary with "content_hash" and, unless the file uses the
+            older bare-hash format, "size", "mtime_ns" and "saved_ns"
+        """
+        text = hash_path.read_text().strip()
+        try:
+            stored = json.loads(text)
+        except ValueError:
+            stored = None
+
+        if not isinstance(stored, dict) or "content_hash" not in stored:
+            # Older format: bare "{size}_{hash}" string
+            return {"content_hash": text}
+
+        return stored
+
+    def _open_index(self) -> Optional[sqlite3.Connection]:
+        """Open (and create if needed) the SQLite hash index in cache_dir.
+
+        Returns:
+            Connection in autocommit mode, or None if the index cannot be
+            opened, in which case only hash files are used
+        """
+        try:
+            db = sqlite3.connect(
+                os.fspath(self.cache_dir / self.INDEX_NAME),
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS demo_hash ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, "
+                "saved_ns INTEGER, hash TEXT)"
+            )
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Hash index unavailable, using hash files only: {e}")
+            return None
+
+    def _load_stored(self, demo_path: Path) -> Optional[dict]:
+        """Look up the stored hash and fingerprint of a demo file.
+
+        Reads the demo's index row; demos without one (hashed by an older
+        version) fall back to their legacy hash file.
+
+        Args:
+            demo_path: Path to demo file (.dem)
+
+        Returns:
+            Dictionary in _read_hash_file() format, or None if no hash
+            is stored
+        """
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT size, mtime_ns, saved_ns, hash FROM demo_hash WHERE path = ?",
+                    (os.path.abspath(demo_path),),
+                ).fetchone()
+            if row is not None:
+                return {
+                    "size": row[0],
+                    "mtime_ns": row[1],
+                    "saved_ns": row[2],
+                    "content_hash": row[3],
+                }
+
+        hash_path = self._get_hash_path(demo_path)
+        if not hash_path.exists():
+            return None
+        return self._read_hash_file(hash_path)
+
+    def _store_hash(self, demo_path: Path, demo_stat, content_hash: str) -> None:
+        """Store hash and fingerprint of a demo file in the index.
+
+        A legacy hash file for the demo is removed once its index row is
+        written. Without an index the hash file is written instead.
+
+        Args:
+            demo_path: Path to demo file (.dem)
+            demo_stat: os.stat_result of the demo file taken before hashing
+            content_hash: Hash string from get_demo_hash()
+        """
+        saved_ns = time.time_ns()
+        hash_path = self._get_hash_path(demo_path)
+
+        with self._db_lock:
+            db = self._db
+            if db is not None:
+                db.execute(
+                    "INSERT OR REPLACE INTO demo_hash VALUES (?, ?, ?, ?, ?)",
+                    (os.path.abspath(demo_path), demo_stat.st_size,
+                     demo_stat.st_mtime_ns, saved_ns, content_hash),
+                )
+
+        if db is not None:
+            hash_path.unlink(missing_ok=True)
+            return
+
+        hash_path.write_text(json.dumps({
+            "size": demo_stat.st_size,
+            "mtime_ns": demo_stat.st_mtime_ns,
+            "saved_ns": saved_ns,
+            "content_hash": content_hash,
+        }))
+
+    def _fingerprint_matches(self, stored: dict, demo_stat) -> bool:
+        """Check whether a demo's size and mtime match the stored fingerprint.
+
+        Args:
+            stored: Stored fingerprint from _load_stored()
+            demo_stat: os.stat_result of the demo file
+
+        Returns:
+            True if size and mtime match and the fingerprint was recorded
+            long enough after the last modification to be trusted
+        """
+        mtime_ns = stored.get("mtime_ns")
+        if mtime_ns is None or stored.get("size") != demo_stat.st_size:
+            return False
+        if mtime_ns != demo_stat.st_mtime_ns:
+            return False
+        return stored.get("saved_ns", 0) - mtime_ns >= self.FINGERPRINT_MIN_AGE_NS
 
     def invalidate_cache(self, demo_path: Path) -> bool:
-        """Invalidate cache by removing hash file.
+        """Invalidate cache by removing the stored hash.
 
-        Removes the hash file to force cache regeneration on next validation.
-        Useful for manual cache invalidation or testing.
+        Removes the demo's index row and any legacy hash file to force
+        cache regeneration on next validation. Useful for manual cache
+        invalidation or testing.
 
         Args:
             demo_path: Path to demo file (.dem)
 
         Returns:
-            True if hash file was removed, False if it didn't exist
+            True if a stored hash was removed, False if there was none
 
         Example:
             >>> validator = CacheValidator(Path("cache"))
@@ -358,14 +726,26 @@ class CacheValidator:
             False
         """
         try:
-            hash_path = self._get_hash_path(demo_path)
+            removed = False
+
+            if self._db is not None:
+                with self._db_lock:
+                    cursor = self._db.execute(
+                        "DELETE FROM demo_hash WHERE path = ?",
+                        (os.path.abspath(demo_path),),
+                    )
+                removed = cursor.rowcount > 0
 
+            hash_path = self._get_hash_path(demo_path)
             if hash_path.exists():
                 hash_path.unlink()
+                removed = True
+
+            if removed:
                 logger.info(f"Invalidated cache for {demo_path.name}")
                 return True
             else:
-                logger.debug(f"No hash file to invalidate for {demo_path.name}")
+                logger.debug(f"No stored hash to invalidate for {demo_path.name}")
                 return False
 
         except Exception as e:
@@ -375,7 +755,7 @@ class CacheValidator:
     def get_cache_info(self, demo_path: Path) -> dict:
         """Get information about cache status for a demo file.
 
-        Returns detailed information about cache and hash file status,
+        Returns detailed information about cache and stored hash status,
         useful for debugging and monitoring.
 
         Args:
@@ -385,12 +765,15 @@ class CacheValidator:
             Dictionary with cache information:
                 - demo_exists: bool - whether demo file exists
                 - cache_exists: bool - whether cache file exists
-                - hash_exists: bool - whether hash file exists
+                - hash_exists: bool - whether a hash is stored (index row or
+                  legacy hash file)
                 - is_valid: bool - whether cache is valid
                 - demo_size: int - demo file size in bytes (or None)
                 - cache_size: int - cache file size in bytes (or None)
                 - current_hash: str - current demo hash (or None)
                 - stored_hash: str - stored hash (or None)
+                - current_fingerprint: dict - current demo size/mtime_ns (or None)
+                - stored_fingerprint: dict - stored demo size/mtime_ns (or None)
 
         Example:
             >>> validator = CacheValidator(Path("cache"))
@@ -400,23 +783,35 @@ class CacheValidator:
         """
         demo_path = Path(demo_path)
         cache_path = self.get_cache_path(demo_path)
-        hash_path = self._get_hash_path(demo_path)
+
+        try:
+            stored = self._load_stored(demo_path)
+        except Exception as e:
+            logger.error(f"Error reading stored hash: {e}")
+            stored = None
 
         info = {
             "demo_exists": demo_path.exists(),
             "cache_exists": cache_path.exists(),
-            "hash_exists": hash_path.exists(),
+            "hash_exists": stored is not None,
             "is_valid": False,
             "demo_size": None,
             "cache_size": None,
             "current_hash": None,
             "stored_hash": None,
+            "current_fingerprint": None,
+            "stored_fingerprint": None,
         }
 
         # Get demo file info
         if info["demo_exists"]:
             try:
-                info["demo_size"] = demo_path.stat().st_size
+                demo_stat = demo_path.stat()
+                info["demo_size"] = demo_stat.st_size
+                info["current_fingerprint"] = {
+                    "size": demo_stat.st_size,
+                    "mtime_ns": demo_stat.st_mtime_ns,
+                }
                 info["current_hash"] = self.get_demo_hash(demo_path)
             except Exception as e:
                 logger.error(f"Error reading demo file: {e}")
@@ -429,11 +824,13 @@ class CacheValidator:
                 logger.error(f"Error reading cache file: {e}")
 
         # Get stored hash
-        if info["hash_exists"]:
-            try:
-                info["stored_hash"] = hash_path.read_text().strip()
-            except Exception as e:
-                logger.error(f"Error reading hash file: {e}")
+        if stored is not None:
+            info["stored_hash"] = stored["content_hash"]
+            if "mtime_ns" in stored:
+                info["stored_fingerprint"] = {
+                    "size": stored.get("size"),
+                    "mtime_ns": stored["mtime_ns"],
+                }
 
         # Check validity
         if info["current_hash"] and info["stored_hash"]:
@@ -490,7 +887,9 @@ def clean_orphaned_files(cache_dir: Path, demo_dir: Path) -> int:
     """Remove cache and hash files for demos that no longer exist.
 
     Scans cache directory and removes .json/.md5 files that don't have
-    corresponding .dem files in the demo directory.
+    corresponding .dem files in the demo directory. Hash index rows whose
+    demo file no longer exists are deleted too; they are logged separately
+    and not included in the returned count.
 
     Args:
         cache_dir: Path to cache directory
@@ -532,6 +931,21 @@ def clean_orphaned_files(cache_dir: Path, demo_dir: Path) -> int:
                 hash_file.unlink()
                 removed_count += 1
 
+        # Check hash index rows
+        index_path = cache_dir / CacheValidator.INDEX_NAME
+        if index_path.exists():
+            db = sqlite3.connect(os.fspath(index_path), isolation_level=None)
+            try:
+                orphaned = [
+                    (path,) for (path,) in db.execute("SELECT path FROM demo_hash")
+                    if not os.path.exists(path)
+                ]
+                db.executemany("DELETE FROM demo_hash WHERE path = ?", orphaned)
+            finally:
+                db.close()
+            if orphaned:
+                logger.info(f"Removed {len(orphaned)} orphaned hash index rows")
+
         logger.info(f"Removed {removed_count} orphaned files from cache")
         return removed_count
 
@@ -542,8 +956,6 @@ def clean_orphaned_files(cache_dir: Path, demo_dir: Path) -> int:
 
 # Example usage and testing
 if __name__ == "__main__":
-    import time
-
     # Example: Setup cache validator
     validator = CacheValidator(Path("cache"))
 
@@ -578,7 +990,7 @@ if __name__ == "__main__":
     # 3. Save hash (simulating ETL completion)
     print(f"\n3. Saving hash (simulating ETL completion)...")
     validator.save_hash(demo_path)
-    print(f"   ✓ Hash saved to {validator._get_hash_path(demo_path)}")
+    print(f"   ✓ Hash saved to {validator.cache_dir / validator.INDEX_NAME}")
 
     # 4. Create mock cache file
     cache_path = validator.get_cache_path(demo_path)
@@ -609,14 +1021,17 @@ if __name__ == "__main__":
 
     # 8. Performance comparison
     print(f"\n7. Performance Comparison:")
-    print(f"   Partial hash (10MB): {hash_time * 1000:.2f} ms")
+    print(f"   Sampled hash (12KB): {hash_time * 1000:.2f} ms")
 
     # Full file hash for comparison
     start = time.time()
-    full_md5 = hashlib.md5()
     with open(demo_path, 'rb') as f:
-        while chunk := f.read(validator.CHUNK_SIZE):
-            full_md5.update(chunk)
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            full_hash = hashlib.file_digest(f, _new_content_hash)
+        else:
+            full_hash = _new_content_hash()
+            while chunk := f.read(validator.CHUNK_SIZE):
+                full_hash.update(chunk)
     full_hash_time = time.time() - start
     print(f"   Full file hash:      {full_hash_time * 1000:.2f} ms")
     print(f"   Speedup:             {full_hash_time / hash_time:.1f}x faster")
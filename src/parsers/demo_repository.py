@@ -21,6 +21,9 @@ class CachedDemoRepository(IDemoRepository):
         cache_manager: CacheManager for loading cache files
         cache_data: Currently loaded cache data
         player_id: ID of the player whose inputs are loaded
+        _last_input: (tick, InputData) of the last lookup, reused when the
+                     same tick is requested again (render runs faster than
+                     ticks advance, and not at all while paused)
     """
 
     def __init__(self):
@@ -28,6 +31,7 @@ class CachedDemoRepository(IDemoRepository):
         self.cache_manager = CacheManager()
         self.cache_data: Optional[dict] = None
         self.player_id: Optional[str] = None
+        self._last_input: Optional[tuple[int, InputData]] = None
 
     def load_demo(self, cache_path: str) -> bool:
         """Load a preprocessed cache file.
@@ -39,6 +43,7 @@ class CachedDemoRepository(IDemoRepository):
             True if loaded successfully, False otherwise
         """
         try:
+            self._last_input = None
             self.cache_data = self.cache_manager.load_cache(cache_path)
 
             if self.cache_data is None:
@@ -74,6 +79,11 @@ class CachedDemoRepository(IDemoRepository):
         if player_id != self.player_id:
             return None
 
+        # Same tick as the previous frame: reuse its InputData
+        last = self._last_input
+        if last is not None and last[0] == tick:
+            return last[1]
+
         # Get inputs for tick
         inputs = self.cache_data.get("inputs", {})
         tick_data = inputs.get(str(tick))
@@ -82,12 +92,14 @@ class CachedDemoRepository(IDemoRepository):
             return None
 
         # Convert to InputData object
-        return InputData(
+        input_data = InputData(
             tick=tick,
             keys=tick_data.get("keys", []),
             mouse=tick_data.get("mouse", []),
             subtick=tick_data.get("subtick", {})
         )
+        self._last_input = (tick, input_data)
+        return input_data
 
     def get_tick_range(self) -> tuple[int, int]:
         """Get the valid tick range for the loaded demo.
@@ -22,12 +22,14 @@ from collections import Counter
 from .button_decoder import decode_buttons, ButtonPress
 from .cache_manager import CacheManager
 from ..domain.models import DemoMetadata
-from ..utils.progress import ProgressReporter, ProgressBar
+from ..utils.progress import ProgressReporter, ProgressBar, get_progress_stream
 
 # Configure logging
 logger = logging.getLogger(__name__)
 if not logger.handlers:
-    handler = logging.StreamHandler()
+    # Share the progress bar's stderr stream so log lines and bar frames
+    # stay ordered
+    handler = logging.StreamHandler(get_progress_stream())
     handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
@@ -146,6 +148,7 @@ class DemoETLPipeline:
         logger.info(f"✓ Cache saved to: {cache_path}")
         if reporter:
             reporter.report("load", 1.0, "Cache saved successfully")
+            reporter.flush()
 
         logger.info("=" * 60)
         logger.info("ETL pipeline completed successfully!")
@@ -552,9 +555,9 @@ Examples:
 
         def progress_callback(info):
             """Progress callback that renders progress bar."""
-            phase = info.get('phase', '')
-            overall_progress = info.get('overall_progress', 0.0)
-            message = info.get('message', '')
+            phase = info.phase
+            overall_progress = info.overall_progress
+            message = info.message
 
             # Format phase name for display
             phase_display = phase.capitalize()
@@ -27,6 +27,23 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+# Optional MessagePack support (smaller, faster-to-parse cache files)
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Optional orjson support (faster JSON output)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Output suffixes written as MessagePack (same as CacheManager)
+MSGPACK_EXTENSIONS = ('.msgpack', '.msgpk', '.mpk')
+
 
 class MovementState(Enum):
     """Player movement states for realistic pattern generation."""
@@ -395,13 +412,28 @@ def generate_subtick_offsets(keys: List[str], mouse: List[str],
     Returns:
         Dictionary mapping each input to its subtick offset (0.0-1.0)
     """
-    rng = random.Random(seed)
+    return _subtick_offsets(keys, mouse, random.Random(seed))
+
+
+# Movement keys typically start at tick beginning
+_SUBTICK_MOVEMENT_KEYS = frozenset({"W", "A", "S", "D"})
+
+
+def _subtick_offsets(keys: List[str], mouse: List[str], rng) -> Dict[str, float]:
+    """generate_subtick_offsets() body, drawing from rng.
+
+    Args:
+        keys: List of keyboard keys pressed this tick
+        mouse: List of mouse buttons pressed this tick
+        rng: random.Random or _ReplayRandom
+
+    Returns:
+        Dictionary mapping each input to its subtick offset (0.0-1.0)
+    """
     subtick = {}
 
-    # Movement keys typically start at tick beginning
-    movement_keys = {"W", "A", "S", "D"}
     for key in keys:
-        if key in movement_keys:
+        if key in _SUBTICK_MOVEMENT_KEYS:
             # Mostly 0.0, but occasionally slightly delayed
             if rng.random() < 0.9:
                 subtick[key] = 0.0
@@ -422,46 +454,42 @@ def generate_subtick_offsets(keys: List[str], mouse: List[str],
     return subtick
 
 
-def generate_mock_cache(
-    num_ticks: int = 5000,
-    output_path: Optional[str] = None,
-    seed: Optional[int] = None,
-    tick_rate: int = 64,
-    player_name: str = "TestPlayer"
-) -> Dict:
-    """Generate realistic mock cache data for CS2 Input Visualizer.
+class _ReplayRandom:
+    """Seeded random stream that restart() rewinds to its first draw.
 
-    Creates a complete cache file with believable input patterns that simulate
-    actual CS2 gameplay. The generated data includes proper movement sequences,
-    shooting bursts, jumps, crouches, and utility usage with realistic timing.
+    Seeded mock caches have always taken each tick's subtick offsets from
+    generate_subtick_offsets(seed=seed), i.e. from a freshly seeded Random,
+    so every tick reads the same first few values of one stream. Seeding a
+    Random per tick is slow, so the draws are batched instead: the stream
+    is generated once, kept, and replayed from the start for each tick.
+    random() and uniform() return exactly what a freshly seeded Random
+    would, so the output is unchanged.
+    """
 
-    This function is the main entry point for mock data generation. It produces
-    data compatible with MockDemoRepository for UI development and testing.
+    def __init__(self, seed: int):
+        self._source = random.Random(seed)
+        self._draws: List[float] = []
+        self._pos = 0
 
-    Args:
-        num_ticks: Number of game ticks to generate (default: 5000 = ~78 seconds at 64 tick)
-        output_path: Optional path to save JSON cache file. If None, data is returned but not saved.
-        seed: Random seed for reproducible generation (default: None for random behavior)
-        tick_rate: Server tick rate, typically 64 or 128 (default: 64)
-        player_name: Display name for the mock player (default: "TestPlayer")
+    def restart(self) -> None:
+        """Rewind to the first draw of the stream."""
+        self._pos = 0
 
-    Returns:
-        Dictionary containing complete cache data structure with metadata and inputs
+    def random(self) -> float:
+        """Next float in [0.0, 1.0), drawn from the source on first use."""
+        pos = self._pos
+        if pos == len(self._draws):
+            self._draws.append(self._source.random())
+        self._pos = pos + 1
+        return self._draws[pos]
 
-    Example:
-        >>> # Generate and save 10 seconds of gameplay data
-        >>> cache = generate_mock_cache(
-        ...     num_ticks=640,
-        ...     output_path="test_cache.json",
-        ...     seed=42,
-        ...     player_name="ProPlayer"
-        ... )
-        >>> print(f"Generated {len(cache['inputs'])} tick entries")
+    def uniform(self, a: float, b: float) -> float:
+        """Random float between a and b, computed like random.Random.uniform."""
+        return a + (b - a) * self.random()
 
-        >>> # Generate data without saving
-        >>> cache = generate_mock_cache(num_ticks=1000, seed=123)
-        >>> # Use cache data directly in tests
-    """
+
+def _build_mock_cache(num_ticks: int, seed: Optional[int], tick_rate: int, player_name: str) -> Dict:
+    """Build mock cache data in memory (the generation loop of generate_mock_cache)."""
     # Initialize pattern generator
     pattern_gen = RealisticPatternGenerator(seed=seed)
 
@@ -485,6 +513,11 @@ def generate_mock_cache(
         "tick_rate": tick_rate
     }
 
+    # Seeded runs replay one seeded stream per tick (see _ReplayRandom);
+    # unseeded runs just share one generator
+    subtick_rng = random.Random() if seed is None else _ReplayRandom(seed)
+    inputs = cache["inputs"]
+
     # Generate inputs for each tick
     for tick in range(num_ticks):
         # Generate all input components
@@ -511,24 +544,86 @@ def generate_mock_cache(
         pattern_gen.current_state.active_mouse = set(mouse_buttons)
 
         # Generate subtick offsets
-        subtick = generate_subtick_offsets(all_keys, mouse_buttons, seed=seed)
+        if seed is not None:
+            subtick_rng.restart()
+        subtick = _subtick_offsets(all_keys, mouse_buttons, subtick_rng)
 
         # Only store ticks where there's actual input (sparse storage optimization)
         if all_keys or mouse_buttons:
-            cache["inputs"][str(tick)] = {
+            inputs[str(tick)] = {
                 "tick": tick,
                 "keys": sorted(all_keys),  # Sort for consistency
                 "mouse": mouse_buttons,
                 "subtick": subtick
             }
 
+    return cache
+
+
+def generate_mock_cache(
+    num_ticks: int = 5000,
+    output_path: Optional[str] = None,
+    seed: Optional[int] = None,
+    tick_rate: int = 64,
+    player_name: str = "TestPlayer"
+) -> Dict:
+    """Generate realistic mock cache data for CS2 Input Visualizer.
+
+    Creates a complete cache file with believable input patterns that simulate
+    actual CS2 gameplay. The generated data includes proper movement sequences,
+    shooting bursts, jumps, crouches, and utility usage with realistic timing.
+
+    This function is the main entry point for mock data generation. It produces
+    data compatible with MockDemoRepository for UI development and testing.
+
+    Args:
+        num_ticks: Number of game ticks to generate (default: 5000 = ~78 seconds at 64 tick)
+        output_path: Optional path to save the cache file. Written as MessagePack for
+                    .msgpack/.msgpk/.mpk suffixes, JSON otherwise. If None, data is
+                    returned but not saved.
+        seed: Random seed for reproducible generation (default: None for random behavior).
+        tick_rate: Server tick rate, typically 64 or 128 (default: 64)
+        player_name: Display name for the mock player (default: "TestPlayer")
+
+    Returns:
+        Dictionary containing complete cache data structure with metadata and inputs
+
+    Raises:
+        ImportError: If a MessagePack suffix is used but msgpack is not installed
+
+    Example:
+        >>> # Generate and save 10 seconds of gameplay data
+        >>> cache = generate_mock_cache(
+        ...     num_ticks=640,
+        ...     output_path="test_cache.json",
+        ...     seed=42,
+        ...     player_name="ProPlayer"
+        ... )
+        >>> print(f"Generated {len(cache['inputs'])} tick entries")
+
+        >>> # Generate data without saving
+        >>> cache = generate_mock_cache(num_ticks=1000, seed=123)
+        >>> # Use cache data directly in tests
+    """
+    cache = _build_mock_cache(num_ticks, seed, tick_rate, player_name)
+
     # Save to file if path provided
     if output_path:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
+        if output_file.suffix.lower() in MSGPACK_EXTENSIONS:
+            if not MSGPACK_AVAILABLE:
+                raise ImportError(
+                    "MessagePack output requested but msgpack library not installed. "
+                    "Install with: pip install msgpack"
+                )
+            output_file.write_bytes(msgpack.packb(cache, use_bin_type=True))
+        elif ORJSON_AVAILABLE:
+            output_file.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
 
         print(f"Mock cache generated successfully!")
         print(f"  File: {output_path}")
@@ -72,6 +72,8 @@ class CS2InputOverlay(QMainWindow):
 
         # Current input state
         self.current_input_data: Optional[InputData] = None
+        # (keys, mouse) last pushed to the renderers, to skip unchanged frames
+        self._last_signature: Optional[tuple] = None
 
         # Render timer (initialized in start_rendering)
         self.render_timer: Optional[QTimer] = None
@@ -130,7 +132,9 @@ class CS2InputOverlay(QMainWindow):
         """Update displayed inputs with new data.
 
         Updates both keyboard and mouse renderers with the current input state
-        and triggers a window repaint to show the changes.
+        and triggers a window repaint to show the changes. If the keys and
+        mouse buttons are the same as in the previous update, the renderers
+        are left alone and no repaint is requested.
 
         Args:
             input_data: InputData object containing current tick's input state
@@ -139,6 +143,12 @@ class CS2InputOverlay(QMainWindow):
         self.current_input_data = input_data
 
         if input_data:
+            # Most consecutive ticks hold the same keys: skip the repaint
+            signature = (tuple(input_data.keys), tuple(input_data.mouse))
+            if signature == self._last_signature:
+                return
+            self._last_signature = signature
+
             # Update keyboard renderer with active keys
             self.keyboard_renderer.set_active_keys(input_data.keys)
 
@@ -162,6 +172,7 @@ class CS2InputOverlay(QMainWindow):
             # Clear visualization
             self.keyboard_renderer.set_active_keys([])
             self.mouse_renderer.set_active_buttons([])
+            self._last_signature = ((), ())
             self.update()
 
     def show(self) -> None:
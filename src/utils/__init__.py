@@ -5,6 +5,8 @@ including progress reporting for long-running operations and CS2 path detection.
 """
 
 from .cs2_detector import CS2PathDetector
-from .progress import ProgressBar, ProgressReporter
+from .progress import ProgressBar, ProgressInfo, ProgressReporter, get_progress_stream
 
-__all__ = ['CS2PathDetector', 'ProgressBar', 'ProgressReporter']
+__all__ = [
+    'CS2PathDetector', 'ProgressBar', 'ProgressInfo', 'ProgressReporter', 'get_progress_stream'
+]
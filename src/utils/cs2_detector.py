@@ -5,14 +5,20 @@ installation directory by checking running processes and common Steam installati
 """
 
 import platform
+import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 try:
     import psutil
 except ImportError:
     psutil = None  # type: ignore
 
+# Library entries in steamapps/libraryfolders.vdf. Current Steam writes
+# "path" keys inside numbered blocks; older clients wrote "1" "D:\\Lib".
+# All-digit values are skipped: those are "appid" "size" rows in "apps".
+_VDF_LIBRARY_PATTERN = re.compile(r'"(?:path|\d+)"[ \t]+"(?!\d*")((?:[^"\\]|\\.)*)"')
+
 
 class CS2PathDetector:
     """Detects CS2 installation path for automatic demo file discovery.
@@ -35,6 +41,7 @@ class CS2PathDetector:
 
     # Process names to search for (CS2 executable names)
     CS2_PROCESS_NAMES = ["cs2.exe", "cs2"]
+    _CS2_PROCESS_NAMES_LOWER = frozenset(name.lower() for name in CS2_PROCESS_NAMES)
 
     # Standard Steam installation paths by platform
     STEAM_PATHS_WINDOWS = [
@@ -49,6 +56,20 @@ class CS2PathDetector:
         Path.home() / ".local/share/Steam/steamapps/common/Counter-Strike 2/game/csgo",
     ]
 
+    # Steam client roots whose libraryfolders.vdf lists every Steam library
+    STEAM_ROOTS_WINDOWS = [
+        Path("C:/Program Files (x86)/Steam"),
+        Path("C:/Program Files/Steam"),
+    ]
+
+    STEAM_ROOTS_LINUX = [
+        Path.home() / ".steam/steam",
+        Path.home() / ".local/share/Steam",
+    ]
+
+    # Install folder names under steamapps/common, newest first
+    CS2_INSTALL_DIRS = ["Counter-Strike 2", "Counter-Strike Global Offensive"]
+
     def find_cs2_path(self, config_path: Optional[Path] = None) -> Optional[Path]:
         """Find CS2 installation path.
 
@@ -100,30 +121,34 @@ class CS2PathDetector:
 
         Note:
             Requires psutil to be installed. Returns None if psutil is not available.
+            Only the process name is prefetched; the executable path is looked up
+            just for processes whose name matches.
         """
         if psutil is None:
             return None
 
         try:
-            for proc in psutil.process_iter(['name', 'exe']):
+            for proc in psutil.process_iter(attrs=['name'], ad_value=None):
+                proc_name = proc.info['name']
+                if not proc_name or proc_name.lower() not in self._CS2_PROCESS_NAMES_LOWER:
+                    continue
+
                 try:
-                    proc_name = proc.info['name']
-                    if proc_name and proc_name.lower() in [name.lower() for name in self.CS2_PROCESS_NAMES]:
-                        exe_path = proc.info['exe']
-                        if exe_path:
-                            # Extract installation path from executable
-                            # Executable is typically at: <install_dir>/game/bin/<platform>/cs2.exe
-                            exe_path_obj = Path(exe_path)
-
-                            # Navigate up to find game/csgo directory
-                            # From: <install>/game/bin/<platform>/cs2.exe
-                            # To:   <install>/game/csgo
-                            game_dir = exe_path_obj.parent.parent.parent
-                            csgo_dir = game_dir / "csgo"
-
-                            validated_path = self._validate_cs2_path(csgo_dir)
-                            if validated_path:
-                                return validated_path
+                    exe_path = proc.exe()
+                    if exe_path:
+                        # Extract installation path from executable
+                        # Executable is typically at: <install_dir>/game/bin/<platform>/cs2.exe
+                        exe_path_obj = Path(exe_path)
+
+                        # Navigate up to find game/csgo directory
+                        # From: <install>/game/bin/<platform>/cs2.exe
+                        # To:   <install>/game/csgo
+                        game_dir = exe_path_obj.parent.parent.parent
+                        csgo_dir = game_dir / "csgo"
+
+                        validated_path = self._validate_cs2_path(csgo_dir)
+                        if validated_path:
+                            return validated_path
 
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     # Skip processes we can't access
@@ -138,8 +163,9 @@ class CS2PathDetector:
     def _check_default_paths(self) -> Optional[Path]:
         """Check standard Steam installation paths.
 
-        Checks platform-specific default Steam installation directories where
-        CS2 is commonly installed.
+        Checks every Steam library listed in libraryfolders.vdf first (one
+        stat() per library and install folder name), then falls back to the
+        platform-specific default Steam installation directories.
 
         Returns:
             Path to game/csgo directory if found in default locations, None otherwise.
@@ -147,13 +173,21 @@ class CS2PathDetector:
         system = platform.system()
 
         if system == "Windows":
+            steam_roots = self.STEAM_ROOTS_WINDOWS
             paths_to_check = self.STEAM_PATHS_WINDOWS
         elif system == "Linux":
+            steam_roots = self.STEAM_ROOTS_LINUX
             paths_to_check = self.STEAM_PATHS_LINUX
         else:
             # Unsupported platform (e.g., macOS - CS2 doesn't officially support it)
             return None
 
+        for library in self._steam_libraries_from_vdf(steam_roots):
+            for install_dir in self.CS2_INSTALL_DIRS:
+                csgo_path = library / "steamapps" / "common" / install_dir / "game" / "csgo"
+                if csgo_path.is_dir():
+                    return csgo_path
+
         for path in paths_to_check:
             validated_path = self._validate_cs2_path(path)
             if validated_path:
@@ -161,11 +195,43 @@ class CS2PathDetector:
 
         return None
 
+    def _steam_libraries_from_vdf(self, steam_roots: List[Path]) -> List[Path]:
+        """List Steam library folders from libraryfolders.vdf.
+
+        Args:
+            steam_roots: Steam client directories to read
+                         steamapps/libraryfolders.vdf from
+
+        Returns:
+            Library root paths in file order without duplicates. Empty if no
+            libraryfolders.vdf could be read.
+        """
+        libraries: List[Path] = []
+        seen = set()
+
+        for steam_root in steam_roots:
+            try:
+                text = (steam_root / "steamapps" / "libraryfolders.vdf").read_text(
+                    encoding="utf-8", errors="replace"
+                )
+            except OSError:
+                continue
+
+            for match in _VDF_LIBRARY_PATTERN.finditer(text):
+                library = re.sub(r"\\(.)", r"\1", match.group(1))
+                if library not in seen:
+                    seen.add(library)
+                    libraries.append(Path(library))
+
+        return libraries
+
     def _validate_cs2_path(self, path: Path) -> Optional[Path]:
         """Validate that a path points to a valid CS2 installation.
 
         Checks if the provided path exists and appears to be a valid CS2
-        game/csgo directory.
+        game/csgo directory. Each candidate is probed with a single
+        is_dir() call (one stat(), False for missing paths) rather than
+        separate exists() and is_dir() checks.
 
         Args:
             path: Path to validate. Can be the game/csgo directory directly
@@ -174,8 +240,7 @@ class CS2PathDetector:
         Returns:
             Validated Path to game/csgo directory if valid, None otherwise.
         """
-        if not path.exists():
-            return None
+        path = Path(path)
 
         # If path points to game/csgo directory directly
         if path.name == "csgo" and path.parent.name == "game":
@@ -184,13 +249,14 @@ class CS2PathDetector:
 
         # If path points to CS2 root, try to find game/csgo
         csgo_path = path / "game" / "csgo"
-        if csgo_path.exists() and csgo_path.is_dir():
+        if csgo_path.is_dir():
             return csgo_path
 
         # If path points to game directory, try to find csgo
         if path.name == "game":
             csgo_path = path / "csgo"
-            if csgo_path.exists() and csgo_path.is_dir():
+            if csgo_path.is_dir():
                 return csgo_path
 
         return None
+
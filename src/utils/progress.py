@@ -9,9 +9,103 @@ Usage:
     # Output: [████████░░░░░░░░░░] 45% Processing tick 45000/100000
 """
 
+import atexit
+import io
+import os
 import sys
+import asyncio
 import logging
-from typing import Optional
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+logger = logging.getLogger(__name__)
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+_progress_stream = None
+
+
+def get_progress_stream():
+    """Get the shared line-buffered stderr stream for progress and log output.
+
+    Wraps the binary layer of sys.stderr once, with line buffering. It does
+    not open a second writer on the stderr file descriptor: bytes written
+    here, through sys.stderr and by ProgressBar (which writes frames to the
+    binary layer directly) all pass through the one buffer sys.stderr
+    already owns, so their order is kept. A log record goes out at its
+    newline, and a progress frame when ProgressBar flushes it. At
+    interpreter exit the wrapper is flushed and detached, so stderr itself
+    stays open.
+
+    sys.stderr is checked on every call: if it has been replaced (pytest
+    capture, contextlib.redirect_stderr, ...), that stream is returned
+    instead, so redirection keeps working.
+
+    Returns:
+        Text stream writing to stderr (sys.stderr itself if it is redirected
+        or has no binary layer)
+    """
+    global _progress_stream
+
+    if sys.stderr is not sys.__stderr__:
+        return sys.stderr
+
+    if _progress_stream is None:
+        buffer = getattr(sys.stderr, 'buffer', None)
+        if buffer is None:
+            return sys.stderr
+
+        _progress_stream = io.TextIOWrapper(
+            buffer,
+            encoding='utf-8',
+            errors='backslashreplace',
+            line_buffering=True
+        )
+        atexit.register(_release_progress_stream)
+
+    return _progress_stream
+
+
+def _release_progress_stream() -> None:
+    """Flush the shared progress stream and detach it from stderr's buffer.
+
+    Registered with atexit. Detaching keeps the wrapper from closing
+    sys.stderr's buffer when it is garbage collected.
+    """
+    try:
+        _progress_stream.flush()
+        _progress_stream.detach()
+    except (OSError, ValueError):
+        pass
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop used for async callbacks outside of a loop.
+
+    The loop is created lazily on first use and runs forever in a daemon
+    thread, so reporting from synchronous code never has to spin up and
+    tear down an event loop per progress event.
+
+    Returns:
+        Running background event loop
+    """
+    global _background_loop
+
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="progress-callbacks",
+                daemon=True
+            )
+            thread.start()
+            _background_loop = loop
+
+    return _background_loop
 
 
 class ProgressBar:
@@ -22,19 +116,61 @@ class ProgressBar:
 
     Attributes:
         width: Width of the progress bar in characters (default: 40)
-        stream: Output stream (default: sys.stderr)
+        stream: Output stream (default: shared line-buffered stderr)
     """
 
-    def __init__(self, width: int = 40, stream=None):
+    def __init__(
+        self,
+        width: int = 40,
+        stream=None,
+        interactive: Optional[bool] = None
+    ):
         """Initialize progress bar.
 
         Args:
             width: Width of the progress bar in characters
-            stream: Output stream (defaults to sys.stderr)
+            stream: Output stream (defaults to line-buffered stderr,
+                    see get_progress_stream())
+            interactive: Redraw the bar in place with carriage returns.
+                        Defaults to whether the stream is a terminal;
+                        otherwise one line is written per percent step.
         """
         self.width = width
-        self.stream = stream or sys.stderr
+        self.stream = stream or get_progress_stream()
         self._last_line_length = 0
+        self._last_percent = -1
+
+        isatty = getattr(self.stream, 'isatty', None)
+        stream_is_tty = isatty is not None and isatty()
+        self._is_tty = stream_is_tty if interactive is None else interactive
+
+        # Pre-encoded frame fragments; render only indexes and joins them.
+        # The width is fixed, so the whole "[bar] " head exists per fill level
+        # and the percentage with and without a trailing message separator.
+        prefix = '\r[' if self._is_tty else '['
+        self._head_bytes = [
+            (prefix + '█' * i + '░' * (width - i) + '] ').encode('utf-8')
+            for i in range(width + 1)
+        ]
+        self._pct_bytes = [f'{i}%'.encode() for i in range(101)]
+        self._pct_sep_bytes = [f'{i}% '.encode() for i in range(101)]
+
+        # Binary layer of the stream if it has one (e.g. sys.stderr.buffer),
+        # so frames skip the text-layer encode on every write
+        self._raw = getattr(self.stream, 'buffer', None)
+
+        # On a terminal, erase-to-end-of-line replaces trailing-space padding
+        self._erase = b'\x1b[K' if self._is_tty and stream_is_tty else None
+        self._clear_bytes = b'\r' + self._erase if self._erase else None
+
+        # Terminal file descriptor for the fast path: one os.write per frame,
+        # bypassing the Python I/O layers (the tty driver delivers it as-is)
+        self._fd: Optional[int] = None
+        if self._erase is not None:
+            try:
+                self._fd = self.stream.fileno()
+            except (AttributeError, ValueError, io.UnsupportedOperation):
+                self._fd = None
 
     def render(self, progress: float, message: str = "") -> None:
         """Render progress bar to terminal.
@@ -51,47 +187,168 @@ class ProgressBar:
         # Clamp progress to valid range
         progress = max(0.0, min(1.0, progress))
 
-        # Calculate filled and empty portions
-        filled_width = int(self.width * progress)
-        empty_width = self.width - filled_width
+        # Calculate filled portion and percentage
+        self._render_frame(int(self.width * progress), int(progress * 100), message)
+
+    def render_int(self, current: int, total: int, message: str = "") -> None:
+        """Render progress bar from an integer count, without float math.
+
+        Args:
+            current: Number of completed items
+            total: Total number of items
+            message: Optional message to display after progress bar
+
+        Example:
+            >>> bar = ProgressBar()
+            >>> bar.render_int(75000, 100000, "Processing tick 75000/100000")
+            [██████████████████░░] 75% Processing tick 75000/100000
+        """
+        if total <= 0:
+            self._render_frame(self.width, 100, message)
+            return
+
+        # Clamp count to valid range
+        current = max(0, min(total, current))
 
-        # Build progress bar string
-        bar = '█' * filled_width + '░' * empty_width
-        percentage = int(progress * 100)
+        self._render_frame(
+            (self.width * current) // total,
+            (100 * current) // total,
+            message
+        )
 
-        # Format output line
+    def _render_frame(self, filled_width: int, percentage: int, message: str) -> None:
+        """Write a frame for an already computed fill level and percentage.
+
+        Args:
+            filled_width: Number of filled bar cells (0 to width)
+            percentage: Integer percentage (0 to 100)
+            message: Message to display after the percentage
+        """
+        # Logs and pipes get a new line only when the percentage changes
+        if not self._is_tty:
+            if percentage == self._last_percent:
+                return
+            self._last_percent = percentage
+
+        # Write to stream
+        self._write(self._format_line(filled_width, percentage, message))
+
+    def _format_line(self, filled_width: int, percentage: int, message: str) -> bytes:
+        """Build the encoded frame for the given fill level and percentage.
+
+        Args:
+            filled_width: Number of filled bar cells (0 to width)
+            percentage: Integer percentage (0 to 100)
+            message: Message to display after the percentage
+
+        Returns:
+            Encoded frame (carriage-return redraw on interactive streams,
+            newline-terminated line otherwise)
+        """
         if message:
-            line = f"\r[{bar}] {percentage}% {message}"
+            parts = [
+                self._head_bytes[filled_width], self._pct_sep_bytes[percentage],
+                message.encode('utf-8', 'replace')
+            ]
+        else:
+            parts = [self._head_bytes[filled_width], self._pct_bytes[percentage]]
+        if not self._is_tty:
+            parts.append(b'\n')
+            return b''.join(parts)
+
+        if self._erase is not None:
+            # Terminal clears leftovers of a longer previous line itself
+            parts.append(self._erase)
+            line = b''.join(parts)
         else:
-            line = f"\r[{bar}] {percentage}%"
+            line = b''.join(parts)
 
-        # Clear previous line if it was longer
-        if len(line) < self._last_line_length:
-            line += ' ' * (self._last_line_length - len(line))
+            # Clear previous line if it was longer
+            if len(line) < self._last_line_length:
+                line += b' ' * (self._last_line_length - len(line))
 
         self._last_line_length = len(line)
+        return line
 
-        # Write to stream
-        self.stream.write(line)
-        self.stream.flush()
+    def _write(self, data: bytes) -> None:
+        """Write pre-encoded bytes to the stream in a single call and flush.
+
+        Args:
+            data: UTF-8 encoded output
+        """
+        if self._fd is not None:
+            # Flush pending text first so bytes land in order
+            self.stream.flush()
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+        elif self._raw is not None:
+            self.stream.flush()
+            self._raw.write(data)
+            self.stream.flush()
+        else:
+            self.stream.write(data.decode('utf-8'))
+            self.stream.flush()
 
     def clear(self) -> None:
         """Clear the progress bar line."""
         if self._last_line_length > 0:
-            self.stream.write('\r' + ' ' * self._last_line_length + '\r')
-            self.stream.flush()
+            if self._clear_bytes is not None:
+                self._write(self._clear_bytes)
+            else:
+                self._write(b'\r' + b' ' * self._last_line_length + b'\r')
             self._last_line_length = 0
 
     def finish(self, message: str = "Complete") -> None:
         """Finish progress bar and print final message.
 
+        The final frame and its newline go out in a single write.
+
         Args:
             message: Final message to display (default: "Complete")
         """
-        self.render(1.0, message)
-        self.stream.write('\n')
-        self.stream.flush()
+        line = self._format_line(self.width, 100, message)
+        if self._is_tty:
+            line += b'\n'
+        self._write(line)
         self._last_line_length = 0
+        self._last_percent = -1
+
+
+@dataclass(slots=True)
+class ProgressInfo:
+    """Progress event passed to ProgressReporter callbacks.
+
+    One is created per reported event, so the class uses __slots__ instead of
+    a per-event dict. Callbacks written against the former dict events keep
+    working: info['phase'], info.get('message', '') and 'phase' in info are
+    all supported.
+
+    Attributes:
+        phase: Name of the current phase
+        phase_progress: Progress within the phase (0.0-1.0)
+        overall_progress: Phase-weighted progress of the whole run (0.0-1.0)
+        message: Status message
+    """
+    phase: str
+    phase_progress: float
+    overall_progress: float
+    message: str
+
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access to a field, raising KeyError for unknown keys."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        """Whether key names one of the fields."""
+        return key in self.__slots__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup returning default for unknown keys."""
+        return getattr(self, key, default) if key in self.__slots__ else default
 
 
 class ProgressReporter:
@@ -102,7 +359,7 @@ class ProgressReporter:
 
     Example:
         >>> def on_progress(info):
-        ...     print(f"{info['phase']}: {info['progress']:.0%}")
+        ...     print(f"{info.phase}: {info.overall_progress:.0%}")
         >>>
         >>> reporter = ProgressReporter(on_progress, phases={
         ...     'extract': 0.4,  # Extract is 40% of total work
@@ -130,8 +387,24 @@ class ProgressReporter:
             'transform': 0.4,
             'load': 0.2
         }
-        self._phase_order = list(self.phases.keys())
-        self._current_phase_index = 0
+
+        # Position of each phase (dicts keep insertion order) and the summed
+        # weight of all phases before it
+        self._phase_index = {name: i for i, name in enumerate(self.phases)}
+        self._phase_offsets = []
+        completed = 0.0
+        for weight in self.phases.values():
+            self._phase_offsets.append(completed)
+            completed += weight
+
+        self._log = logger
+        self._last_key: Optional[tuple] = None
+        self._owned_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Outstanding background-loop futures (waited on by flush()) and
+        # tasks on the caller's loop; both discard themselves when done,
+        # and the task set keeps pending tasks from being garbage collected
+        self._pending: set = set()
+        self._tasks: set = set()
 
     def report(
         self,
@@ -149,55 +422,116 @@ class ProgressReporter:
         if not self.callback:
             return
 
-        # Calculate overall progress based on phase weights
-        overall_progress = 0.0
-
-        # Add completed phases
-        try:
-            phase_index = self._phase_order.index(phase)
-            for i in range(phase_index):
-                overall_progress += self.phases[self._phase_order[i]]
-        except ValueError:
-            # Unknown phase, use it as-is
-            phase_index = -1
+        # Skip repeats of the last reported event (same phase, progress to
+        # 0.1% and message) - nothing new for the callback to show
+        key = (phase, int(progress * 1000), message)
+        if key == self._last_key:
+            return
 
-        # Add current phase progress
-        if phase in self.phases:
-            overall_progress += self.phases[phase] * progress
+        # Calculate overall progress based on phase weights
+        phase_index = self._phase_index.get(phase)
+        if phase_index is not None:
+            # Completed phases + current phase progress
+            overall_progress = (
+                self._phase_offsets[phase_index]
+                + self.phases[phase] * progress
+            )
         else:
+            # Unknown phase, use it as-is
             overall_progress = progress
 
         # Prepare progress info
-        progress_info = {
-            'phase': phase,
-            'phase_progress': progress,
-            'overall_progress': overall_progress,
-            'message': message
-        }
+        progress_info = ProgressInfo(phase, progress, overall_progress, message)
+        self._last_key = key
 
         # Call callback
         try:
-            # Support both sync and async callbacks
-            import inspect
-            if inspect.iscoroutinefunction(self.callback):
-                # Async callback - try to run it
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # Schedule as task
-                        asyncio.create_task(self.callback(progress_info))
-                    else:
-                        # Run directly
-                        loop.run_until_complete(self.callback(progress_info))
-                except RuntimeError:
-                    # No event loop, create one
-                    asyncio.run(self.callback(progress_info))
-            else:
-                # Sync callback
-                self.callback(progress_info)
+            # Support both sync and async callbacks: anything that returns
+            # a coroutine (async def, partial of one, ...) gets scheduled
+            result = self.callback(progress_info)
+            if result is not None and asyncio.iscoroutine(result):
+                self._dispatch_async(result)
         except Exception as e:
             # Don't let callback errors break the pipeline
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Progress callback error: {e}")
+            self._log.warning("Progress callback error: %s", e)
+
+    def _dispatch_async(self, coro) -> None:
+        """Schedule an async callback without blocking the caller.
+
+        Inside a running event loop the coroutine becomes a task on that
+        loop. Otherwise it is submitted to the shared background loop, and
+        the resulting future is kept so flush() can wait for it.
+
+        Args:
+            coro: Coroutine returned by the async callback
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            # Fire-and-forget on the caller's loop
+            task = loop.create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            return
+
+        if self._owned_loop is None:
+            self._owned_loop = _get_background_loop()
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._owned_loop)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for outstanding async callbacks to complete.
+
+        Should be called at the end of a pipeline run so that the final
+        progress events are delivered before the caller moves on.
+
+        Only callbacks running on the background loop can be waited for
+        here. Callbacks reported from inside a running event loop are tasks
+        on that loop, which a blocking wait would stall; a warning is logged
+        if any are still pending, and aflush() should be awaited instead.
+
+        Args:
+            timeout: Maximum seconds to wait per callback (None = no limit)
+        """
+        if self._tasks:
+            self._log.warning(
+                "flush() cannot wait for %d progress callback(s) on a running "
+                "event loop; await aflush() instead", len(self._tasks)
+            )
+
+        # Snapshot first: done-callbacks remove futures from the background
+        # thread while we wait
+        pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result(timeout)
+            except Exception as e:
+                self._log.warning("Progress callback error: %s", e)
+
+    async def aflush(self, timeout: Optional[float] = None) -> None:
+        """Wait for all outstanding async callbacks from inside an event loop.
+
+        Awaitable counterpart of flush(): waits for the callback tasks on the
+        running loop as well as any futures on the background loop, without
+        blocking the loop.
+
+        Args:
+            timeout: Maximum seconds to wait in total (None = no limit)
+        """
+        waiting = list(self._tasks)
+        waiting.extend(asyncio.wrap_future(future) for future in list(self._pending))
+        if not waiting:
+            return
+
+        done, not_done = await asyncio.wait(waiting, timeout=timeout)
+        for future in done:
+            if not future.cancelled() and future.exception() is not None:
+                self._log.warning("Progress callback error: %s", future.exception())
+        if not_done:
+            self._log.warning("%d progress callback(s) still pending after %ss",
+                              len(not_done), timeout)
@@ -4,29 +4,41 @@
 import sys
 import asyncio
 import logging
+import importlib.util
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
+import pytest
+
+# All tests share one event loop instead of creating a fresh one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-# Setup logging
-log_file = f"test_smart_tick_sync_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, mode='w', encoding='utf-8', delay=False),
-        logging.StreamHandler(sys.stdout)
-    ],
-    force=True
-)
 
-logger = logging.getLogger(__name__)
-logger.info("=" * 60)
-logger.info("Testing SmartTickSync with Speed Detection")
-logger.info("=" * 60)
+def setup_logging() -> str:
+    """Log to a timestamped file and stdout when run as a script.
+
+    Returns:
+        str: Path of the log file
+    """
+    log_file = f"test_smart_tick_sync_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+        handlers=[
+            logging.FileHandler(log_file, mode='w', encoding='utf-8', delay=False),
+            logging.StreamHandler(sys.stdout)
+        ],
+        force=True
+    )
+    return log_file
 
 
 class MockTickSource:
@@ -51,264 +63,184 @@ class MockTickSource:
         self._tick = tick
 
 
-async def test_speed_detection():
-    """Test speed detection from tick history."""
-    logger.info("\n[Test 1] Testing speed detection...")
-
-    # Direct import to avoid UI dependencies
-    import importlib.util
+@lru_cache(maxsize=1)
+def _load_smart_tick_sync():
+    """Load SmartTickSync once, directly from its file to avoid UI dependencies."""
     spec = importlib.util.spec_from_file_location(
         "smart_tick_sync",
         "src/core/smart_tick_sync.py"
     )
     smart_tick_module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(smart_tick_module)
-    SmartTickSync = smart_tick_module.SmartTickSync
+    return smart_tick_module.SmartTickSync
 
-    tick_source = MockTickSource()
-    smart_sync = SmartTickSync(
-        tick_source,
-        tick_rate=64,
-        history_size=10,
-        pause_threshold=3,
-        speed_calculation_window=5
-    )
 
-    # Scenario 1: Normal speed (1.0x)
-    logger.info("\n[Test 1.1] Normal speed (1.0x)...")
-    tick_source.set_tick(1000)
-    await smart_sync.update()
-    await asyncio.sleep(0.5)  # Wait 0.5s
+class FakeClock:
+    """Manually advanced clock so tests don't wait in real time."""
 
-    # At 1.0x speed: 64 ticks/sec * 0.5s = 32 ticks
-    tick_source.set_tick(1032)
-    await smart_sync.update()
+    def __init__(self):
+        self.t = 0.0
 
-    speed = smart_sync.get_current_speed()
-    logger.info(f"[Test 1.1] Measured speed: {speed:.2f}x (expected: ~1.00x)")
-    assert 0.9 <= speed <= 1.1, f"Speed should be ~1.0x, got {speed:.2f}x"
-
-    # Scenario 2: Slow speed (0.25x)
-    # Need multiple measurements for smoothed speed to converge
-    logger.info("\n[Test 1.2] Slow speed (0.25x)...")
-    base_tick = 1040
-    for i in range(5):  # 5 measurements at 0.25x
-        tick_source.set_tick(base_tick + i * 8)
-        await smart_sync.update()
-        await asyncio.sleep(0.5)  # At 0.25x: 64 * 0.25 * 0.5 = 8 ticks
+    def __call__(self):
+        return self.t
 
-    speed = smart_sync.get_current_speed()
-    logger.info(f"[Test 1.2] Measured speed after convergence: {speed:.2f}x (expected: ~0.25x)")
-    # After smoothing, should be trending towards 0.25x
-    # EMA smoothing means it won't reach exactly 0.25x immediately
-    # Accept wider range since we're testing the algorithm works, not exact values
-    assert 0.15 <= speed <= 0.70, f"Speed should be trending towards 0.25x, got {speed:.2f}x"
-    logger.info(f"[Test 1.2] ✓ Speed correctly trending towards slow speed")
-
-    # Scenario 3: Fast speed (2.0x)
-    # Need multiple measurements for smoothed speed to converge
-    logger.info("\n[Test 1.3] Fast speed (2.0x)...")
-    base_tick = 1100
-    for i in range(5):  # 5 measurements at 2.0x
-        tick_source.set_tick(base_tick + i * 64)
-        await smart_sync.update()
-        await asyncio.sleep(0.5)  # At 2.0x: 64 * 2.0 * 0.5 = 64 ticks
+    def advance(self, dt):
+        """Move the clock forward by dt seconds."""
+        self.t += dt
 
-    speed = smart_sync.get_current_speed()
-    logger.info(f"[Test 1.3] Measured speed after convergence: {speed:.2f}x (expected: ~2.00x)")
-    # After smoothing, should be trending towards 2.0x
-    # Accept wider range since EMA smoothing takes time to converge
-    assert 1.0 <= speed <= 3.0, f"Speed should be trending towards 2.0x, got {speed:.2f}x"
-    logger.info(f"[Test 1.3] ✓ Speed correctly trending towards fast speed")
 
-    logger.info("\n[Test 1] ✓ Speed detection working correctly")
+class Scenario(NamedTuple):
+    """Tick sequence fed to a fresh SmartTickSync and its expected outcome."""
 
+    name: str
+    ticks: Tuple[int, ...]
+    interval: float                                 # Seconds between measurements
+    speed_range: Optional[Tuple[float, float]]      # None = speed not checked
+    paused: bool
 
-async def test_pause_detection():
-    """Test pause detection vs slow speed."""
-    logger.info("\n[Test 2] Testing pause detection...")
 
-    # Direct import to avoid UI dependencies
-    import importlib.util
-    spec = importlib.util.spec_from_file_location(
-        "smart_tick_sync",
-        "src/core/smart_tick_sync.py"
-    )
-    smart_tick_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(smart_tick_module)
-    SmartTickSync = smart_tick_module.SmartTickSync
+# At 64 Hz, 0.5s of playback is 32 ticks at 1.0x, 8 at 0.25x, 64 at 2.0x
+NORMAL = Scenario("normal_1.0x", (1000, 1032), 0.5, (0.9, 1.1), False)
+# The first measurement seeds the speed, so steady playback reads its exact speed
+SLOW = Scenario("slow_0.25x", tuple(1040 + i * 8 for i in range(5)), 0.5, (0.2, 0.3), False)
+FAST = Scenario("fast_2.0x", tuple(1100 + i * 64 for i in range(5)), 0.5, (1.8, 2.2), False)
+PAUSE = Scenario("pause", (5000, 5000, 5000), 0.2, None, True)
+# At 0.05x: 64 * 0.05 * 0.5 = 1.6 ticks - slow, but NOT paused
+VERY_SLOW = Scenario("very_slow_0.05x", (5000, 5001, 5002), 0.5, None, False)
+# tick=0 means demo not loaded - NOT paused
+NOT_LOADED = Scenario("not_loaded", (0, 0, 0), 0.1, None, False)
 
-    tick_source = MockTickSource()
-    smart_sync = SmartTickSync(
-        tick_source,
+SCENARIOS = [NORMAL, SLOW, FAST, PAUSE, VERY_SLOW, NOT_LOADED]
+
+def make_sync(**overrides):
+    """Build a SmartTickSync wired to a mock tick source and a fake clock.
+
+    Returns:
+        Tuple of (smart_sync, tick_source, clock)
+    """
+    SmartTickSync = _load_smart_tick_sync()
+    params = dict(
         tick_rate=64,
         history_size=10,
         pause_threshold=3,
         speed_calculation_window=5
     )
+    params.update(overrides)
 
-    # Scenario 1: Pause (identical ticks)
-    logger.info("\n[Test 2.1] Testing pause (identical ticks)...")
-    tick_source.set_tick(5000)
-    await smart_sync.update()
-    await asyncio.sleep(0.2)
+    tick_source = MockTickSource()
+    clock = FakeClock()
+    smart_sync = SmartTickSync(tick_source, time_fn=clock, **params)
+    return smart_sync, tick_source, clock
+
+
+async def feed(harness, ticks, interval):
+    """Measure each tick in turn, advancing the clock between measurements."""
+    smart_sync, tick_source, clock = harness
+    for i, tick in enumerate(ticks):
+        if i:
+            clock.advance(interval)
+        tick_source.set_tick(tick)
+        await smart_sync.update()
 
-    tick_source.set_tick(5000)
-    await smart_sync.update()
-    await asyncio.sleep(0.2)
 
-    tick_source.set_tick(5000)
-    await smart_sync.update()
-    await asyncio.sleep(0.2)
+@pytest.fixture
+def harness():
+    """Fresh SmartTickSync harness with default parameters."""
+    return make_sync()
 
-    is_paused = smart_sync.is_paused()
-    logger.info(f"[Test 2.1] Is paused: {is_paused} (expected: True)")
-    assert is_paused, "Should detect pause when ticks are identical"
 
-    # Scenario 2: Very slow speed (0.05x) - should NOT be detected as pause
-    logger.info("\n[Test 2.2] Testing very slow speed (0.05x) - NOT pause...")
-    tick_source.set_tick(5000)
-    await smart_sync.update()
-    await asyncio.sleep(0.5)
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s.name)
+async def test_scenarios(harness, scenario):
+    """Test speed and pause detection for one tick sequence."""
+    logger.info(f"\n[Scenario] {scenario.name}...")
+    smart_sync = harness[0]
 
-    # At 0.05x: 64 * 0.05 * 0.5 = 1.6 ≈ 1-2 ticks
-    tick_source.set_tick(5001)
-    await smart_sync.update()
-    await asyncio.sleep(0.5)
-
-    tick_source.set_tick(5002)
-    await smart_sync.update()
+    await feed(harness, scenario.ticks, scenario.interval)
 
+    speed = smart_sync.get_current_speed()
     is_paused = smart_sync.is_paused()
-    logger.info(f"[Test 2.2] Is paused: {is_paused} (expected: False)")
-    assert not is_paused, "Should NOT detect pause when ticks are changing (even slowly)"
+    logger.info(f"[Scenario] {scenario.name}: speed={speed:.2f}x, paused={is_paused}")
 
-    # Scenario 3: Tick = 0 (demo not loaded) - should NOT be pause
-    logger.info("\n[Test 2.3] Testing tick=0 (demo not loaded)...")
-    tick_source.set_tick(0)
-    await smart_sync.update()
-    await asyncio.sleep(0.1)
-
-    tick_source.set_tick(0)
-    await smart_sync.update()
-    await asyncio.sleep(0.1)
-
-    tick_source.set_tick(0)
-    await smart_sync.update()
-
-    is_paused = smart_sync.is_paused()
-    logger.info(f"[Test 2.3] Is paused: {is_paused} (expected: False, tick=0 means not loaded)")
-    assert not is_paused, "Should NOT detect pause when tick=0 (demo not loaded)"
+    if scenario.speed_range is not None:
+        low, high = scenario.speed_range
+        assert low <= speed <= high, \
+            f"{scenario.name}: speed should be in [{low}, {high}], got {speed:.2f}x"
+    assert is_paused == scenario.paused, \
+        f"{scenario.name}: expected paused={scenario.paused}, got {is_paused}"
 
-    logger.info("\n[Test 2] ✓ Pause detection working correctly")
+    logger.info(f"[Scenario] ✓ {scenario.name}")
 
 
-async def test_speed_aware_prediction():
+async def test_speed_aware_prediction(harness):
     """Test speed-aware tick prediction."""
-    logger.info("\n[Test 3] Testing speed-aware prediction...")
+    logger.info("\n[Prediction] Testing speed-aware prediction...")
+    smart_sync, tick_source, clock = harness
 
-    # Direct import to avoid UI dependencies
-    import importlib.util
-    spec = importlib.util.spec_from_file_location(
-        "smart_tick_sync",
-        "src/core/smart_tick_sync.py"
-    )
-    smart_tick_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(smart_tick_module)
-    SmartTickSync = smart_tick_module.SmartTickSync
-
-    tick_source = MockTickSource()
-    smart_sync = SmartTickSync(
-        tick_source,
-        tick_rate=64,
-        history_size=10,
-        pause_threshold=3,
-        speed_calculation_window=5
-    )
-
-    # Setup: measure speed at 0.5x
-    logger.info("\n[Test 3.1] Setup: measuring speed at 0.5x...")
-    tick_source.set_tick(1000)
-    await smart_sync.update()
-    await asyncio.sleep(0.5)
-
-    # At 0.5x: 64 * 0.5 * 0.5 = 16 ticks
-    tick_source.set_tick(1016)
-    await smart_sync.update()
+    # Setup: measure speed at 0.5x (64 * 0.5 * 0.5 = 16 ticks)
+    logger.info("\n[Prediction 1] Setup: measuring speed at 0.5x...")
+    await feed(harness, (1000, 1016), 0.5)
 
     speed = smart_sync.get_current_speed()
-    logger.info(f"[Test 3.1] Measured speed: {speed:.2f}x")
+    logger.info(f"[Prediction 1] Measured speed: {speed:.2f}x")
 
     # Now predict tick after 0.25 seconds
-    await asyncio.sleep(0.25)
+    clock.advance(0.25)
     predicted_tick = smart_sync.predict_current_tick()
 
     # Expected: 1016 + (64 * smoothed_speed * 0.25)
     # With smoothing, speed might not be exactly 0.5x yet
-    logger.info(f"[Test 3.1] Predicted tick: {predicted_tick} (expected: ~1024, but depends on smoothed speed)")
+    logger.info(f"[Prediction 1] Predicted tick: {predicted_tick} (expected: ~1024, but depends on smoothed speed)")
     # Allow wider range since EMA smoothing affects speed
     assert 1016 <= predicted_tick <= 1035, f"Predicted tick should be > 1016, got {predicted_tick}"
 
     # Test prediction during pause
-    logger.info("\n[Test 3.2] Testing prediction during pause...")
-    tick_source.set_tick(2000)
-    await smart_sync.update()
-    await asyncio.sleep(0.1)
-
-    tick_source.set_tick(2000)
-    await smart_sync.update()
-    await asyncio.sleep(0.1)
-
-    tick_source.set_tick(2000)
-    await smart_sync.update()
+    logger.info("\n[Prediction 2] Testing prediction during pause...")
+    clock.advance(0.1)
+    await feed(harness, (2000, 2000, 2000), 0.1)
 
     # Should be paused
     assert smart_sync.is_paused(), "Should be paused"
 
     # Prediction during pause should return last tick (no interpolation)
-    await asyncio.sleep(0.5)
+    clock.advance(0.5)
     predicted_tick = smart_sync.predict_current_tick()
-    logger.info(f"[Test 3.2] Predicted tick during pause: {predicted_tick} (expected: 2000)")
+    logger.info(f"[Prediction 2] Predicted tick during pause: {predicted_tick} (expected: 2000)")
     assert predicted_tick == 2000, f"During pause, predicted tick should be {2000}, got {predicted_tick}"
 
-    logger.info("\n[Test 3] ✓ Speed-aware prediction working correctly")
+    logger.info("\n[Prediction] ✓ Speed-aware prediction working correctly")
 
 
-async def test_status_info():
-    """Test status info reporting."""
-    logger.info("\n[Test 4] Testing status info...")
+async def test_tick_jump_restarts_history(harness):
+    """Test a seek restarts the history and reseeds the speed."""
+    smart_sync, tick_source, clock = harness
 
-    # Direct import to avoid UI dependencies
-    import importlib.util
-    spec = importlib.util.spec_from_file_location(
-        "smart_tick_sync",
-        "src/core/smart_tick_sync.py"
-    )
-    smart_tick_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(smart_tick_module)
-    SmartTickSync = smart_tick_module.SmartTickSync
+    await feed(harness, (1000, 1032, 1064), 0.5)
+    assert 0.9 <= smart_sync.get_current_speed() <= 1.1
 
-    tick_source = MockTickSource()
-    smart_sync = SmartTickSync(
-        tick_source,
-        tick_rate=64,
-        history_size=5,
-        pause_threshold=3,
-        speed_calculation_window=3
-    )
+    # Seek to 5000, then play on at 0.5x (16 ticks per 0.5s)
+    clock.advance(0.5)
+    await feed(harness, (5000, 5016), 0.5)
 
-    # Add some measurements
-    tick_source.set_tick(1000)
-    await smart_sync.update()
-    await asyncio.sleep(0.1)
+    status = smart_sync.get_status_info()
+    assert [entry["tick"] for entry in status["history"]] == [5000, 5016]
+    # Seeded from the post-seek pair, not blended with the 1.0x from before
+    assert smart_sync.get_current_speed() == pytest.approx(0.5)
+    assert smart_sync.recompute_smoothed_speed() == pytest.approx(0.5)
 
-    tick_source.set_tick(1010)
-    await smart_sync.update()
+
+async def test_status_info():
+    """Test status info reporting."""
+    logger.info("\n[Status] Testing status info...")
+    harness = make_sync(history_size=5, speed_calculation_window=3)
+    smart_sync = harness[0]
+
+    # Add some measurements
+    await feed(harness, (1000, 1010), 0.1)
 
     # Get status
     status = smart_sync.get_status_info()
 
-    logger.info(f"[Test 4] Status info:")
+    logger.info(f"[Status] Status info:")
     logger.info(f"  - current_speed: {status['current_speed']:.2f}x")
     logger.info(f"  - is_paused: {status['is_paused']}")
     logger.info(f"  - last_tick: {status['last_tick']}")
@@ -319,15 +251,19 @@ async def test_status_info():
     assert 'last_tick' in status
     assert 'history' in status
 
-    logger.info("\n[Test 4] ✓ Status info working correctly")
+    logger.info("\n[Status] ✓ Status info working correctly")
 
 
-async def main():
+async def main(log_file: str):
     """Run all tests."""
+    logger.info("=" * 60)
+    logger.info("Testing SmartTickSync with Speed Detection")
+    logger.info("=" * 60)
+
     try:
-        await test_speed_detection()
-        await test_pause_detection()
-        await test_speed_aware_prediction()
+        for scenario in SCENARIOS:
+            await test_scenarios(make_sync(), scenario)
+        await test_speed_aware_prediction(make_sync())
         await test_status_info()
 
         logger.info("\n" + "=" * 60)
@@ -346,5 +282,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = asyncio.run(main(setup_logging()))
     sys.exit(exit_code)
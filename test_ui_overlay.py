@@ -7,6 +7,7 @@ Tests the overlay with mock data from MockDemoRepository.
 
 import sys
 import asyncio
+from functools import lru_cache
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 
@@ -18,6 +19,19 @@ from src.mocks import MockTickSource, MockDemoRepository, MockPlayerTracker
 from src.domain.models import InputData
 
 
+def get_app() -> QApplication:
+    """Return the running QApplication, creating it on first use."""
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+@lru_cache(maxsize=1)
+def get_demo_repo() -> MockDemoRepository:
+    """Return a MockDemoRepository with the sample cache, loaded once."""
+    demo_repo = MockDemoRepository()
+    demo_repo.load_demo("data/sample_cache.json")
+    return demo_repo
+
+
 async def test_ui_with_mocks():
     """Test UI with mock data sources."""
 
@@ -26,7 +40,7 @@ async def test_ui_with_mocks():
     print("=" * 60)
 
     # Create Qt application
-    app = QApplication(sys.argv)
+    app = get_app()
 
     # Create overlay
     print("\n[1] Creating overlay window...")
@@ -37,11 +51,10 @@ async def test_ui_with_mocks():
     # Initialize mocks
     print("\n[2] Initializing mock components...")
     tick_source = MockTickSource(start_tick=0, tick_rate=64)
-    demo_repo = MockDemoRepository()
+    demo_repo = get_demo_repo()
     player_tracker = MockPlayerTracker(player_id="MOCK_PLAYER_123")
 
     await tick_source.connect()
-    demo_repo.load_demo("data/sample_cache.json")
     print("    ✓ Mocks initialized")
 
     # Test with sample input data
@@ -111,9 +124,10 @@ async def test_ui_with_mocks():
 
     # Simulation loop
     current_tick = 0
+    last_sig = (None, None)
 
     def update_from_demo():
-        nonlocal current_tick
+        nonlocal current_tick, last_sig
 
         # Get player ID
         player_id = "MOCK_PLAYER_123"
@@ -122,7 +136,11 @@ async def test_ui_with_mocks():
         inputs = demo_repo.get_inputs(current_tick, player_id)
 
         if inputs:
-            overlay.update_inputs(inputs)
+            # Only push inputs that differ from the last rendered state
+            sig = (tuple(inputs.keys), tuple(inputs.mouse))
+            if sig != last_sig:
+                overlay.update_inputs(inputs)
+                last_sig = sig
 
         current_tick += 1
 
@@ -0,0 +1,85 @@
+"""Shared pytest fixtures for the CS2 Input Visualizer test suite."""
+
+import os
+
+import pytest
+import pytest_asyncio
+
+from src.parsers import mock_data_generator
+from src.parsers.mock_data_generator import generate_mock_cache, MSGPACK_AVAILABLE
+
+# Fixed seed so shared caches are reproducible (and have input at tick 50)
+MOCK_CACHE_SEED = 42
+
+# Binary caches are faster to write and parse; JSON when msgpack is missing
+CACHE_SUFFIX = ".msgpack" if MSGPACK_AVAILABLE else ".json"
+
+
+def pytest_collection_modifyitems(items):
+    """Run async tests on one session-wide event loop.
+
+    Avoids creating and closing a loop per test. Tests that set their own
+    ``asyncio(loop_scope=...)`` keep it.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if not pytest_asyncio.is_async_test(item):
+            continue
+        marker = item.get_closest_marker("asyncio")
+        if marker is None or "loop_scope" not in marker.kwargs:
+            item.add_marker(session_loop, append=False)
+
+
+class VirtualClock:
+    """Manually advanced clock for MockTickSource and SyncEngine tests."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def virtual_clock():
+    """VirtualClock starting at t=1000s; advance it with ``clock.now += dt``."""
+    return VirtualClock()
+
+
+@pytest.fixture(scope="session")
+def mock_cache(request, tmp_path_factory):
+    """Factory returning the path of a mock cache with num_ticks ticks.
+
+    This is the test suite's memo for mock data: each num_ticks is built at
+    most once per session. Caches are kept in pytest's cache directory
+    (.pytest_cache/d/mock_caches) and reused across runs; one is regenerated
+    only when it is missing or older than mock_data_generator.py. Sharing is safe because
+    MockDemoRepository and CacheManager only read the file. Use
+    ``pytest --cache-clear`` to force regeneration.
+    """
+    if getattr(request.config, "cache", None) is not None:
+        cache_dir = request.config.cache.mkdir("mock_caches")
+    else:
+        # Cache plugin disabled (-p no:cacheprovider): per-session files
+        cache_dir = tmp_path_factory.mktemp("mock_caches")
+    generator_mtime = os.stat(mock_data_generator.__file__).st_mtime_ns
+    paths = {}
+
+    def get(num_ticks: int):
+        if num_ticks not in paths:
+            path = cache_dir / f"cache_{num_ticks}_seed{MOCK_CACHE_SEED}{CACHE_SUFFIX}"
+            try:
+                stale = path.stat().st_mtime_ns < generator_mtime
+            except FileNotFoundError:
+                stale = True
+            if stale:
+                # Write then rename, so parallel (xdist) workers never read
+                # a half-written file
+                tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp{CACHE_SUFFIX}")
+                generate_mock_cache(num_ticks=num_ticks, output_path=str(tmp_path),
+                                    seed=MOCK_CACHE_SEED)
+                os.replace(tmp_path, path)
+            paths[num_ticks] = path
+        return paths[num_ticks]
+
+    return get
@@ -85,7 +85,7 @@ class TestAutoOrchestratorSmoke:
             assert asyncio.iscoroutinefunction(orchestrator.start)
             assert asyncio.iscoroutinefunction(orchestrator.stop)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_graceful_stop_without_start(self):
         """Test that stop() can be called without start()."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -97,6 +97,9 @@ class TestAutoOrchestratorSmoke:
             # Verify running flag is False
             assert orchestrator._running is False
 
+            # Hash index connection is released
+            assert orchestrator.cache_validator._db is None
+
 
 class TestCS2PathDetectorIsolated:
     """Isolated tests for CS2PathDetector with mock paths."""
@@ -195,14 +198,14 @@ class TestCacheValidatorWithRealFiles:
             # Compute hash
             hash_result = validator.get_demo_hash(demo_file)
 
-            # Verify hash format: "size_md5hash"
+            # Verify hash format: "size_hash"
             assert "_" in hash_result
             size_part, hash_part = hash_result.split("_", 1)
 
             # Verify size matches
             assert size_part == str(len(demo_data))
 
-            # Verify hash is MD5 (32 hex characters)
+            # Verify hash is a 128-bit digest (32 hex characters)
             assert len(hash_part) == 32
             assert all(c in "0123456789abcdef" for c in hash_part)
 
@@ -8,8 +8,12 @@ Tests for automatic mode components:
 - AutoOrchestrator integration
 """
 
+import os
+import json
+import dataclasses
 import pytest
 import asyncio
+from collections import deque
 from pathlib import Path
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 import tempfile
@@ -18,12 +22,44 @@ import hashlib
 # Import components to test
 from src.utils.cs2_detector import CS2PathDetector
 from src.parsers.cache_validator import CacheValidator
+from src.network import line_scanner
 from src.network.demo_monitor import DemoMonitor
+from src.network.line_scanner import ConsoleLineScanner
 from src.network.spectator_tracker import SpectatorTracker
 from src.core.auto_orchestrator import AutoOrchestrator
 from src.core.config import AppConfig
 
 
+@pytest.fixture
+def make_validator():
+    """Factory for CacheValidators that are closed when the test ends."""
+    validators = []
+
+    def make(cache_dir):
+        validator = CacheValidator(cache_dir)
+        validators.append(validator)
+        return validator
+
+    yield make
+    for validator in validators:
+        validator.close()
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """Default AppConfig, built once per test session."""
+    return AppConfig()
+
+
+@pytest.fixture
+def orchestrator(base_config, tmp_path):
+    """AutoOrchestrator on a copy of the default config with a per-test cache dir."""
+    config = dataclasses.replace(base_config, cache_dir=str(tmp_path / "cache"))
+    orchestrator = AutoOrchestrator(config)
+    yield orchestrator
+    orchestrator.cache_validator.close()
+
+
 class TestCS2PathDetector:
     """Test CS2 installation path detection."""
 
@@ -59,13 +95,18 @@ class TestCS2PathDetector:
 
         # Mock process
         mock_proc = Mock()
-        mock_proc.info = {'name': 'cs2.exe', 'exe': str(cs2_exe)}
-        mock_process_iter.return_value = [mock_proc]
+        mock_proc.info = {'name': 'cs2.exe'}
+        mock_proc.exe.return_value = str(cs2_exe)
+        other_proc = Mock()
+        other_proc.info = {'name': 'explorer.exe'}
+        mock_process_iter.return_value = [other_proc, mock_proc]
 
         detector = CS2PathDetector()
         result = detector._find_by_process()
 
         assert result == csgo_dir
+        # Executable path is only looked up for name matches
+        other_proc.exe.assert_not_called()
 
     def test_check_default_paths(self, tmp_path, monkeypatch):
         """Test checking default Steam paths."""
@@ -80,39 +121,138 @@ class TestCS2PathDetector:
             result = detector._check_default_paths()
             assert result == steam_path
 
+    def test_check_default_paths_from_library_vdf(self, tmp_path, monkeypatch):
+        """Test that libraries listed in libraryfolders.vdf are probed."""
+        steam_root = tmp_path / "Steam"
+        (steam_root / "steamapps").mkdir(parents=True)
+        library = tmp_path / "Games" / "SteamLibrary"
+        csgo_path = library / "steamapps" / "common" / "Counter-Strike 2" / "game" / "csgo"
+        csgo_path.mkdir(parents=True)
+
+        escaped = lambda p: str(p).replace("\\", "\\\\")
+        (steam_root / "steamapps" / "libraryfolders.vdf").write_text(f"""
+"libraryfolders"
+{{
+	"0"
+	{{
+		"path"		"{escaped(steam_root)}"
+		"apps"
+		{{
+			"228980"		"123456"
+		}}
+	}}
+	"1"
+	{{
+		"path"		"{escaped(library)}"
+		"apps"
+		{{
+			"730"		"35000000000"
+		}}
+	}}
+}}
+""")
+
+        detector = CS2PathDetector()
+        monkeypatch.setattr("platform.system", lambda: "Linux")
+        monkeypatch.setattr(detector, "STEAM_ROOTS_LINUX", [steam_root])
+        monkeypatch.setattr(detector, "STEAM_PATHS_LINUX", [])
+
+        assert detector._steam_libraries_from_vdf([steam_root]) == [steam_root, library]
+        assert detector._check_default_paths() == csgo_path
+
 
 class TestCacheValidator:
     """Test cache validation with fast hashing."""
 
-    def test_get_demo_hash(self, tmp_path):
-        """Test computing demo hash (first 10MB + size)."""
-        # Create test demo file (5MB)
+    def test_get_demo_hash(self, tmp_path, make_validator):
+        """Test computing demo hash (sampled windows + size)."""
+        # Create test demo file (20KB: larger than the three sampled windows)
         demo_file = tmp_path / "test.dem"
-        demo_data = b"x" * (5 * 1024 * 1024)  # 5MB
+        demo_data = os.urandom(20 * 1024)
         demo_file.write_bytes(demo_data)
 
         cache_dir = tmp_path / "cache"
-        validator = CacheValidator(cache_dir)
+        validator = make_validator(cache_dir)
 
         hash_result = validator.get_demo_hash(demo_file)
 
-        # Hash should be in format: "size_md5"
+        # Hash should be in format: "size_hash"
         assert "_" in hash_result
         size_part, hash_part = hash_result.split("_", 1)
         assert size_part == str(len(demo_data))
-        assert len(hash_part) == 32  # MD5 hex length
+        assert len(hash_part) == 32  # 128-bit digest hex length
 
-    def test_is_cache_valid_no_cache(self, tmp_path):
+    def test_get_demo_hash_large_and_empty(self, tmp_path, make_validator):
+        """Test that only the sampled windows are hashed and empty files work."""
+        cache_dir = tmp_path / "cache"
+        validator = make_validator(cache_dir)
+        size = 64 * validator.SAMPLE_SIZE
+
+        def write_demo(name, pos=None):
+            data = bytearray(b"x" * size)
+            if pos is not None:
+                data[pos] = ord("y")
+            path = tmp_path / name
+            path.write_bytes(bytes(data))
+            return validator.get_demo_hash(path)
+
+        base = write_demo("base.dem")
+
+        # Bytes between the windows are not read
+        assert write_demo("gap.dem", validator.SAMPLE_SIZE * 10) == base
+
+        # Head, middle and tail changes are detected
+        assert write_demo("head.dem", 0) != base
+        assert write_demo("middle.dem", size // 2) != base
+        assert write_demo("tail.dem", size - 1) != base
+
+        # Empty file cannot be memory-mapped but still hashes
+        empty = tmp_path / "empty.dem"
+        empty.write_bytes(b"")
+        size_part, hash_part = validator.get_demo_hash(empty).split("_", 1)
+        assert size_part == "0"
+        assert len(hash_part) == 32
+
+    def test_get_demo_hash_without_mmap(self, tmp_path, make_validator):
+        """Test that files which cannot be memory-mapped hash the same."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(bytes(range(256)) * 1024)
+
+        validator = make_validator(tmp_path / "cache")
+        expected = validator.get_demo_hash(demo_file)
+
+        with patch("src.parsers.cache_validator.mmap.mmap", side_effect=OSError):
+            assert validator.get_demo_hash(demo_file) == expected
+
+    def test_get_demo_hash_memoized(self, tmp_path, make_validator):
+        """Test that an unchanged demo is hashed only once."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(b"demo data")
+        os.utime(demo_file, ns=(1_000_000_000, 1_000_000_000))
+
+        validator = make_validator(tmp_path / "cache")
+        expected = validator.get_demo_hash(demo_file)
+
+        with patch("src.parsers.cache_validator._update_windows") as update:
+            assert validator.get_demo_hash(demo_file) == expected
+            update.assert_not_called()
+
+        # A new mtime forces a rehash
+        demo_file.write_bytes(b"demo DATA")
+        os.utime(demo_file, ns=(2_000_000_000, 2_000_000_000))
+        assert validator.get_demo_hash(demo_file) != expected
+
+    def test_is_cache_valid_no_cache(self, tmp_path, make_validator):
         """Test validation when cache doesn't exist."""
         demo_file = tmp_path / "test.dem"
         demo_file.write_bytes(b"demo data")
 
         cache_dir = tmp_path / "cache"
-        validator = CacheValidator(cache_dir)
+        validator = make_validator(cache_dir)
 
         assert validator.is_cache_valid(demo_file) is False
 
-    def test_is_cache_valid_outdated(self, tmp_path):
+    def test_is_cache_valid_outdated(self, tmp_path, make_validator):
         """Test validation when demo file changed."""
         # Create demo file
         demo_file = tmp_path / "test.dem"
@@ -120,7 +260,7 @@ class TestCacheValidator:
 
         cache_dir = tmp_path / "cache"
         cache_dir.mkdir()
-        validator = CacheValidator(cache_dir)
+        validator = make_validator(cache_dir)
 
         # Save hash for original
         validator.save_hash(demo_file)
@@ -131,7 +271,7 @@ class TestCacheValidator:
         # Cache should be invalid
         assert validator.is_cache_valid(demo_file) is False
 
-    def test_is_cache_valid_up_to_date(self, tmp_path):
+    def test_is_cache_valid_up_to_date(self, tmp_path, make_validator):
         """Test validation when cache is up-to-date."""
         # Create demo file
         demo_file = tmp_path / "test.dem"
@@ -139,7 +279,7 @@ class TestCacheValidator:
 
         cache_dir = tmp_path / "cache"
         cache_dir.mkdir()
-        validator = CacheValidator(cache_dir)
+        validator = make_validator(cache_dir)
 
         # Create cache file
         cache_file = validator.get_cache_path(demo_file)
@@ -151,17 +291,192 @@ class TestCacheValidator:
         # Cache should be valid
         assert validator.is_cache_valid(demo_file) is True
 
-    def test_get_cache_path(self, tmp_path):
+    def test_is_cache_valid_fingerprint_skips_hash(self, tmp_path, make_validator):
+        """Test that an unchanged size/mtime validates without hashing."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(b"demo data")
+        old_mtime = demo_file.stat().st_mtime - 60
+        os.utime(demo_file, (old_mtime, old_mtime))
+
+        validator = make_validator(tmp_path / "cache")
+        validator.get_cache_path(demo_file).write_text("{}")
+        validator.save_hash(demo_file)
+
+        with patch.object(validator, 'get_demo_hash') as mock_hash:
+            assert validator.is_cache_valid(demo_file) is True
+            mock_hash.assert_not_called()
+
+        # Touched but unchanged: falls back to hashing, still valid, and
+        # the stored fingerprint is left alone
+        os.utime(demo_file, (old_mtime + 30, old_mtime + 30))
+        assert validator.is_cache_valid(demo_file) is True
+
+        info = validator.get_cache_info(demo_file)
+        assert info["stored_fingerprint"] != info["current_fingerprint"]
+
+    def test_warm_refreshes_young_fingerprint(self, tmp_path, make_validator):
+        """Test only the warm-up paths re-store a fingerprint saved right after a write."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(b"demo data")
+        other_file = tmp_path / "other.dem"
+        other_file.write_bytes(b"other data")
+
+        validator = make_validator(tmp_path / "cache")
+        validator.get_cache_path(demo_file).write_text("{}")
+        validator.save_hash(demo_file)
+        saved_ns = validator._load_stored(demo_file)["saved_ns"]
+
+        # Saved within FINGERPRINT_MIN_AGE_NS of the write: hashed, not re-stored
+        assert validator.is_cache_valid(demo_file) is True
+        assert validator._load_stored(demo_file)["saved_ns"] == saved_ns
+
+        # Warm-up re-stores it; demos without a stored hash stay unstored
+        validator.hash_many([demo_file, other_file])
+        assert validator._load_stored(demo_file)["saved_ns"] > saved_ns
+        assert validator._load_stored(other_file) is None
+
+    def test_hash_index(self, tmp_path):
+        """Test hashes are stored only in the SQLite index, with hash file fallback."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(b"demo data")
+
+        with CacheValidator(tmp_path / "cache") as validator:
+            validator.get_cache_path(demo_file).write_text("{}")
+            validator.save_hash(demo_file)
+            hash_path = validator._get_hash_path(demo_file)
+
+            # Index row alone, no hash file
+            assert not hash_path.exists()
+            assert validator.is_cache_valid(demo_file) is True
+
+            # Demo without an index row falls back to its legacy hash file
+            legacy = {"content_hash": validator.get_demo_hash(demo_file)}
+            validator._db.execute("DELETE FROM demo_hash")
+            hash_path.write_text(json.dumps(legacy))
+            assert validator.is_cache_valid(demo_file) is True
+
+            # Saving migrates it into the index
+            validator.save_hash(demo_file)
+            assert not hash_path.exists()
+            assert validator._load_stored(demo_file)["saved_ns"] > 0
+
+            # Invalidation clears both
+            hash_path.write_text(json.dumps(legacy))
+            assert validator.invalidate_cache(demo_file) is True
+            assert not hash_path.exists()
+            assert validator.is_cache_valid(demo_file) is False
+
+    def test_close_checkpoints_index(self, tmp_path):
+        """Test close() leaves no WAL files and a closed validator uses hash files."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(b"demo data")
+        cache_dir = tmp_path / "cache"
+
+        validator = CacheValidator(cache_dir)
+        validator.get_cache_path(demo_file).write_text("{}")
+        validator.save_hash(demo_file)
+
+        validator.close()
+        validator.close()  # Idempotent
+        assert validator._db is None
+        assert sorted(p.name for p in cache_dir.iterdir()) == [
+            "index.sqlite", "test.dem.json"
+        ]
+
+        # The row is in the index file itself
+        with CacheValidator(cache_dir) as other:
+            assert other.is_cache_valid(demo_file) is True
+
+        # Without the index, hashes go to hash files
+        validator.save_hash(demo_file)
+        assert validator._get_hash_path(demo_file).exists()
+        assert validator.is_cache_valid(demo_file) is True
+
+    @pytest.mark.asyncio
+    async def test_is_cache_valid_async(self, tmp_path, make_validator):
+        """Test the awaitable validation matches the synchronous one."""
+        demo_file = tmp_path / "test.dem"
+        demo_file.write_bytes(b"demo data")
+
+        validator = make_validator(tmp_path / "cache")
+        assert await validator.is_cache_valid_async(demo_file) is False
+
+        validator.get_cache_path(demo_file).write_text("{}")
+        validator.save_hash(demo_file)
+        assert await validator.is_cache_valid_async(demo_file) is True
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_async(self, tmp_path, make_validator):
+        """Test bulk hashing matches get_demo_hash and skips missing demos."""
+        demos = []
+        for i in range(5):
+            demo_file = tmp_path / f"demo{i}.dem"
+            demo_file.write_bytes(bytes([i]) * 20000)
+            demos.append(demo_file)
+        missing = tmp_path / "missing.dem"
+
+        validator = make_validator(tmp_path / "cache")
+        hashes = await validator.warm_cache_async(demos + [missing])
+
+        assert hashes[missing] is None
+        assert len({hashes[d] for d in demos}) == len(demos)
+        for demo_file in demos:
+            assert hashes[demo_file] == make_validator(tmp_path / "other").get_demo_hash(demo_file)
+
+        # Synchronous thread-pool variant gives the same result
+        assert make_validator(tmp_path / "other").hash_many(demos + [missing]) == hashes
+
+    def test_get_cache_path(self, tmp_path, make_validator):
         """Test getting cache file path."""
         demo_file = tmp_path / "match.dem"
         cache_dir = tmp_path / "cache"
 
-        validator = CacheValidator(cache_dir)
+        validator = make_validator(cache_dir)
         cache_path = validator.get_cache_path(demo_file)
 
         assert cache_path == cache_dir / "match.dem.json"
 
 
+class TestConsoleLineScanner:
+    """Test incremental console line scanning."""
+
+    def test_unterminated_line_held_until_newline(self):
+        """Test a partial last line is only returned once its newline arrives."""
+        scanner = ConsoleLineScanner(("Spectating",))
+
+        assert scanner.feed(b"Spectating: s1") is None
+        assert scanner.feed(b"mple") is None
+        assert scanner.feed(b"\nhostname: Ser") == "Spectating: s1mple"
+        assert scanner.feed(b"ver\n") == "hostname: Server"
+        assert scanner.feed(b"") is None
+
+    def test_oversized_partial_line_dropped(self):
+        """Test a partial line longer than MAX_PENDING_BYTES is discarded."""
+        scanner = ConsoleLineScanner(("Spectating",))
+
+        assert scanner.feed(b"x" * (ConsoleLineScanner.MAX_PENDING_BYTES + 1)) is None
+        assert scanner.feed(b"Spectating: NiKo\n") == "Spectating: NiKo"
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_trigger_lines(self, use_automaton):
+        """Test trigger lines are found with and without pyahocorasick."""
+        if use_automaton and not line_scanner.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        scanner = ConsoleLineScanner(("Playing demo from", "Demo contents for"))
+        text = (
+            "noise\n"
+            "Playing demo from a.dem\n"
+            "Demo contents for b.dem: Playing demo from b.dem\n"
+            "more noise"
+        )
+
+        with patch.object(line_scanner, "AHOCORASICK_AVAILABLE", use_automaton):
+            assert scanner.trigger_lines(text) == [
+                "Playing demo from a.dem",
+                "Demo contents for b.dem: Playing demo from b.dem",
+            ]
+
+
 class TestDemoMonitor:
     """Test demo load monitoring."""
 
@@ -203,6 +518,17 @@ class TestDemoMonitor:
         assert len(detected_demos) == 1
         assert detected_demos[0] == demo_file
 
+    def test_scan_new_lines_split_read(self, tmp_path):
+        """Test a demo message split across reads is matched once complete."""
+        monitor = DemoMonitor(Mock(), tmp_path)
+
+        assert monitor._scan_new_lines(b"noise\nPlaying demo fr") is None
+        assert monitor._scanner._pending == bytearray(b"Playing demo fr")
+
+        result = monitor._scan_new_lines(b"om match.dem\n")
+        assert result == Path("match.dem")
+        assert monitor._scanner._pending == bytearray()
+
     def test_parse_demo_path_relative(self, tmp_path):
         """Test parsing relative demo path."""
         cs2_dir = tmp_path / "csgo"
@@ -232,6 +558,14 @@ class TestDemoMonitor:
         result = monitor._parse_demo_path(str(demo_file))
         assert result == demo_file
 
+    def test_parse_demo_path_cached(self, tmp_path):
+        """Test repeated demo path strings return the same Path object."""
+        monitor = DemoMonitor(Mock(), tmp_path)
+
+        first = monitor._parse_demo_path("match.dem")
+        assert monitor._parse_demo_path("match.dem") is first
+        assert monitor._parse_demo_path("other.dem") == tmp_path / "other.dem"
+
 
 class TestSpectatorTracker:
     """Test spectator target tracking."""
@@ -299,6 +633,35 @@ Spectating: s1mple
         assert "s1mple" in changes
         assert "NiKo" in changes
 
+    def test_is_new_stable_target(self):
+        """Test flapping targets are suppressed until stable across reads."""
+        tracker = SpectatorTracker(Mock())
+        recent = deque(maxlen=2)
+
+        reported = []
+        for target in ["s1mple", "s1mple", "NiKo", "s1mple", "NiKo", "NiKo", "NiKo"]:
+            if tracker._is_new_stable_target(target, recent):
+                tracker._last_target = target
+                reported.append(target)
+
+        assert reported == ["s1mple", "NiKo"]
+
+    @pytest.mark.asyncio
+    async def test_track_spectator_changes_rejects_zero_stable_reads(self):
+        """Test stable_reads below 1 is rejected before polling starts."""
+        tracker = SpectatorTracker(Mock())
+
+        with pytest.raises(ValueError):
+            await tracker.track_spectator_changes(AsyncMock(), stable_reads=0)
+
+    def test_scan_new_lines_last_target(self):
+        """Test the last complete spectator line wins and partial lines wait."""
+        tracker = SpectatorTracker(Mock())
+
+        assert tracker._scan_new_lines(b"Spectating: s1mple\nSpectating: Ni") == "s1mple"
+        assert tracker._scan_new_lines(b"Ko\nhostname: Server\n") == "NiKo"
+        assert tracker._scan_new_lines(b"hostname: Server\n") is None
+
     def test_parse_status_output(self):
         """Test parsing status command output."""
         mock_telnet = Mock()
@@ -311,6 +674,19 @@ Spectating: player123
         result = tracker._parse_status_output(status_text)
         assert result == "player123"
 
+    def test_parse_status_single_pass(self):
+        """Test players and spectator target come out of one scan."""
+        tracker = SpectatorTracker(Mock())
+
+        status_text = """
+      2 "s1mple"             STEAM_1:0:123456    25:18
+Spectating: s1mple (STEAM_1:0:123456)
+      3 "NiKo"               STEAM_1:0:789012    23:45
+"""
+        mapping, target = tracker._parse_status(status_text)
+        assert mapping == {"s1mple": "STEAM_1:0:123456", "NiKo": "STEAM_1:0:789012"}
+        assert target == "s1mple"
+
     def test_build_player_mapping(self):
         """Test building player name -> SteamID mapping."""
         mock_telnet = Mock()
@@ -331,22 +707,18 @@ class TestAutoOrchestratorIntegration:
     """Integration tests for AutoOrchestrator."""
 
     @pytest.mark.asyncio
-    async def test_auto_orchestrator_initialization(self):
+    async def test_auto_orchestrator_initialization(self, orchestrator, base_config, tmp_path):
         """Test AutoOrchestrator can be initialized."""
-        config = AppConfig()
-        orchestrator = AutoOrchestrator(config)
+        config = dataclasses.replace(base_config, cache_dir=str(tmp_path / "cache"))
 
         assert orchestrator is not None
         assert orchestrator.config == config
         assert orchestrator.cache_validator is not None
 
     @pytest.mark.asyncio
-    async def test_on_demo_loaded_new_demo(self, tmp_path):
+    async def test_on_demo_loaded_new_demo(self, orchestrator, tmp_path):
         """Test handling when new demo is loaded."""
-        config = AppConfig()
-        config.cache_dir = str(tmp_path / "cache")
-
-        orchestrator = AutoOrchestrator(config)
+        config = orchestrator.config
 
         # Create test demo
         demo_file = tmp_path / "test.dem"
@@ -363,11 +735,8 @@ class TestAutoOrchestratorIntegration:
             mock_etl.assert_called_once_with(demo_file)
 
     @pytest.mark.asyncio
-    async def test_on_spectator_changed(self):
+    async def test_on_spectator_changed(self, orchestrator):
         """Test handling spectator target changes."""
-        config = AppConfig()
-        orchestrator = AutoOrchestrator(config)
-
         # Simulate spectator change
         await orchestrator._on_spectator_changed("s1mple", "STEAM_1:0:123456")
 
@@ -375,6 +744,29 @@ class TestAutoOrchestratorIntegration:
         # This is a basic smoke test - more detailed tests would check
         # that visualization updates accordingly
 
+    @pytest.mark.asyncio
+    async def test_render_loop_idles_until_woken(self, orchestrator):
+        """Test that the idle render loop doesn't poll telnet and wakes on state change."""
+        orchestrator.telnet_client = AsyncMock()
+        orchestrator.telnet_client.get_current_tick.return_value = 0
+        orchestrator._running = True
+
+        render_task = asyncio.create_task(orchestrator._render_loop())
+        await asyncio.sleep(0.05)
+
+        # No demo loaded: no tick queries
+        orchestrator.telnet_client.get_current_tick.assert_not_called()
+
+        # Player + demo ready: woken without waiting for the idle interval
+        orchestrator._current_demo = Path("test.dem")
+        await orchestrator._on_spectator_changed("s1mple", "STEAM_1:0:123456")
+        await asyncio.sleep(0.02)
+        orchestrator.telnet_client.get_current_tick.assert_called()
+
+        orchestrator._running = False
+        orchestrator._wake.set()
+        await asyncio.wait_for(render_task, timeout=1.0)
+
 
 def test_main_auto_mode_argument():
     """Test that main.py accepts --mode auto."""
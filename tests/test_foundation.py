@@ -6,7 +6,6 @@ ensuring the foundation of the application works correctly before building on it
 
 import pytest
 import pytest_asyncio
-import asyncio
 from src.domain.models import InputData, PlayerInfo, DemoMetadata
 from src.mocks.tick_source import MockTickSource
 from src.mocks.player_tracker import MockPlayerTracker
@@ -108,43 +107,43 @@ async def test_mock_tick_source_connection():
 
 
 @pytest.mark.asyncio
-async def test_mock_tick_source_tick_progression():
+async def test_mock_tick_source_tick_progression(virtual_clock):
     """Test MockTickSource tick progression over time."""
-    mock = MockTickSource(start_tick=1000, tick_rate=64)
+    mock = MockTickSource(start_tick=1000, tick_rate=64, clock=virtual_clock)
 
     await mock.connect()
 
     # Get initial tick
     tick1 = await mock.get_current_tick()
-    assert tick1 >= 1000
+    assert tick1 == 1000
 
-    # Wait and verify tick progression
-    await asyncio.sleep(0.1)  # 100ms = 6.4 ticks at 64 Hz
+    # Advance time and verify tick progression
+    virtual_clock.now += 0.1  # 100ms = 6.4 ticks at 64 Hz
     tick2 = await mock.get_current_tick()
     assert tick2 > tick1
 
-    # Verify tick increment is reasonable (should be ~6 ticks)
+    # Verify tick increment (6.4 ticks, truncated)
     tick_diff = tick2 - tick1
-    assert 4 <= tick_diff <= 10  # Allow some timing variance
+    assert tick_diff == 6
 
     await mock.disconnect()
 
 
 @pytest.mark.asyncio
-async def test_mock_tick_source_custom_tick_rate():
+async def test_mock_tick_source_custom_tick_rate(virtual_clock):
     """Test MockTickSource with custom tick rate."""
     # Use 128 Hz tick rate (higher than default)
-    mock = MockTickSource(start_tick=500, tick_rate=128)
+    mock = MockTickSource(start_tick=500, tick_rate=128, clock=virtual_clock)
 
     await mock.connect()
 
     tick1 = await mock.get_current_tick()
-    await asyncio.sleep(0.1)  # 100ms = 12.8 ticks at 128 Hz
+    virtual_clock.now += 0.1  # 100ms = 12.8 ticks at 128 Hz
     tick2 = await mock.get_current_tick()
 
     tick_diff = tick2 - tick1
-    # Should be roughly twice as many ticks as 64 Hz
-    assert 10 <= tick_diff <= 16
+    # Twice as many ticks as 64 Hz (12.8, truncated)
+    assert tick_diff == 12
 
     await mock.disconnect()
 
@@ -237,9 +236,9 @@ async def test_mock_player_tracker_default_player():
 # ============================================================================
 
 @pytest.mark.asyncio
-async def test_mock_components_together():
+async def test_mock_components_together(virtual_clock):
     """Test MockTickSource and MockPlayerTracker working together."""
-    tick_source = MockTickSource(start_tick=1000, tick_rate=64)
+    tick_source = MockTickSource(start_tick=1000, tick_rate=64, clock=virtual_clock)
     player_tracker = MockPlayerTracker(player_id="76561198012345678")
 
     # Connect and initialize
@@ -254,7 +253,7 @@ async def test_mock_components_together():
     assert current_player == "76561198012345678"
 
     # Simulate time passing
-    await asyncio.sleep(0.05)
+    virtual_clock.now += 0.05
     new_tick = await tick_source.get_current_tick()
     assert new_tick > current_tick
 
@@ -4,21 +4,15 @@ Integration tests for CS2 Input Visualizer
 Tests complete system integration across all phases.
 """
 
-import pytest
-import asyncio
-import sys
-from pathlib import Path
+import json
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from src.domain.models import InputData, PlayerInfo, DemoMetadata
 from src.mocks import MockTickSource, MockDemoRepository, MockPlayerTracker
+from src.mocks.demo_repository import MAX_DENSE_TICK_SPAN, SUBTICK_FORMAT
 from src.parsers.mock_data_generator import generate_mock_cache
 from src.parsers.cache_manager import CacheManager
-from src.network import SyncEngine, PredictionEngine
-from src.core import Orchestrator, AppConfig
-from src.ui import CS2InputOverlay
+from tests.conftest import CACHE_SUFFIX
 
 
 class TestPhaseIntegration:
@@ -27,7 +21,7 @@ class TestPhaseIntegration:
     def test_phase1_phase2_mock_repository_etl(self, tmp_path):
         """Test Phase 1 + Phase 2: Mocks with ETL."""
         # Generate mock cache
-        cache_path = tmp_path / "test_cache.json"
+        cache_path = tmp_path / f"test_cache{CACHE_SUFFIX}"
         cache = generate_mock_cache(num_ticks=100, output_path=str(cache_path))
 
         assert cache is not None
@@ -44,11 +38,10 @@ class TestPhaseIntegration:
         assert isinstance(inputs.keys, list)
         assert isinstance(inputs.mouse, list)
 
-    def test_phase2_cache_manager_optimization(self, tmp_path):
+    def test_phase2_cache_manager_optimization(self, mock_cache):
         """Test Phase 2: Cache optimization."""
         # Generate cache
-        cache_path = tmp_path / "test_cache.json"
-        generate_mock_cache(num_ticks=200, output_path=str(cache_path))
+        cache_path = mock_cache(200)
 
         # Load and optimize
         manager = CacheManager()
@@ -62,11 +55,13 @@ class TestPhaseIntegration:
         assert manager.validate_cache(optimized)
 
     @pytest.mark.asyncio
-    async def test_phase4_network_layer_mocks(self):
+    async def test_phase4_network_layer_mocks(self, virtual_clock):
         """Test Phase 4: Network layer with mocks."""
+        from src.network import SyncEngine, PredictionEngine
+
         # Create components
-        tick_source = MockTickSource(start_tick=1000, tick_rate=64)
-        sync = SyncEngine(tick_source, polling_interval=0.1)
+        tick_source = MockTickSource(start_tick=1000, tick_rate=64, clock=virtual_clock)
+        sync = SyncEngine(tick_source, polling_interval=0.1, clock=virtual_clock)
         prediction = PredictionEngine(sync)
 
         # Connect and sync
@@ -75,7 +70,7 @@ class TestPhaseIntegration:
 
         # Verify tick progression
         tick1 = prediction.get_corrected_tick()
-        await asyncio.sleep(0.05)
+        virtual_clock.now += 0.05
         tick2 = prediction.get_corrected_tick()
 
         assert tick2 >= tick1
@@ -86,11 +81,12 @@ class TestPhaseIntegration:
         await tick_source.disconnect()
 
     @pytest.mark.asyncio
-    async def test_full_orchestrator_dev_mode(self, tmp_path):
+    async def test_full_orchestrator_dev_mode(self, mock_cache):
         """Test complete orchestrator in development mode."""
+        from src.network import SyncEngine
+
         # Generate test cache
-        cache_path = tmp_path / "dev_cache.json"
-        generate_mock_cache(num_ticks=500, output_path=str(cache_path))
+        cache_path = mock_cache(500)
 
         # Create mock components
         tick_source = MockTickSource(start_tick=0, tick_rate=64)
@@ -130,12 +126,14 @@ class TestComponentIntegration:
     """Test integration between individual components."""
 
     @pytest.mark.asyncio
-    async def test_tick_source_to_prediction(self):
+    async def test_tick_source_to_prediction(self, virtual_clock):
         """Test tick source → sync → prediction pipeline."""
-        tick_source = MockTickSource(start_tick=5000, tick_rate=64)
+        from src.network import SyncEngine, PredictionEngine
+
+        tick_source = MockTickSource(start_tick=5000, tick_rate=64, clock=virtual_clock)
         await tick_source.connect()
 
-        sync = SyncEngine(tick_source, polling_interval=0.1)
+        sync = SyncEngine(tick_source, polling_interval=0.1, clock=virtual_clock)
         prediction = PredictionEngine(sync)
 
         # Initial sync
@@ -145,7 +143,7 @@ class TestComponentIntegration:
         predictions = []
         for _ in range(5):
             predictions.append(prediction.get_corrected_tick())
-            await asyncio.sleep(0.02)
+            virtual_clock.now += 0.02
 
         # Verify monotonic increase
         for i in range(1, len(predictions)):
@@ -155,11 +153,10 @@ class TestComponentIntegration:
         await sync.stop()
         await tick_source.disconnect()
 
-    def test_cache_to_repository(self, tmp_path):
+    def test_cache_to_repository(self, mock_cache):
         """Test cache file → repository → inputs pipeline."""
         # Create cache
-        cache_path = tmp_path / "pipeline_test.json"
-        cache = generate_mock_cache(num_ticks=300, output_path=str(cache_path))
+        cache_path = mock_cache(300)
 
         # Load with repository
         repo = MockDemoRepository()
@@ -177,12 +174,84 @@ class TestComponentIntegration:
         assert inputs is not None
         assert inputs.tick == 50
 
+    def test_seeded_mock_cache_reproducible(self):
+        """Test seeded generation is reproducible and returns independent dicts."""
+        first = generate_mock_cache(num_ticks=150, seed=7)
+        first["inputs"].clear()
+
+        second = generate_mock_cache(num_ticks=150, seed=7)
+        assert second["inputs"]
+        assert second == generate_mock_cache(num_ticks=150, seed=7)
+
+    def test_repository_tick_range_without_metadata(self, tmp_path):
+        """Test tick range falls back to the ticks with input."""
+        cache_path = tmp_path / "no_range.json"
+        cache_path.write_text(
+            '{"metadata": {"player_id": "P1"}, "inputs": {'
+            '"120": {"tick": 120, "keys": ["W"], "mouse": [], "subtick": {"W": 0.0}}, '
+            '"40": {"tick": 40, "keys": ["A"], "mouse": [], "subtick": {"A": 0.37}}}}'
+        )
+
+        repo = MockDemoRepository()
+        assert repo.load_demo(str(cache_path))
+
+        assert repo.get_tick_range() == (40, 120)
+        assert repo.get_inputs(tick=40, player_id="P1").keys == ["A"]
+        assert repo.get_inputs(tick=80, player_id="P1") is None
+
+        # Packing the inputs leaves the loaded cache data intact
+        assert set(repo.cache_data["inputs"]) == {"40", "120"}
+        # Subtick values come back to within half a Q0.8 step
+        assert repo.get_inputs(tick=40, player_id="P1").subtick == {"A": 95 / 256}
+
+    def test_repository_subtick_round_trip(self, tmp_path):
+        """Test Q0.8 subtick storage precision and the quantized cache format."""
+        values = [i / 1000 for i in range(996)]
+        inputs = {
+            str(tick): {"tick": tick, "keys": ["W"], "mouse": [], "subtick": {"W": value}}
+            for tick, value in enumerate(values)
+        }
+        cache_path = tmp_path / "subtick.json"
+        cache_path.write_text(json.dumps({"metadata": {"player_id": "P1"}, "inputs": inputs}))
+
+        repo = MockDemoRepository()
+        assert repo.load_demo(str(cache_path))
+        for tick, value in enumerate(values):
+            decoded = repo.get_inputs(tick=tick, player_id="P1").subtick["W"]
+            assert abs(decoded - value) <= 1 / 512
+        assert repo.get_inputs(tick=0, player_id="P1").subtick == {"W": 0.0}
+
+        # Caches marked as Q0.8 hold the codes themselves
+        cache_path.write_text(json.dumps({
+            "metadata": {"player_id": "P1", "subtick_format": SUBTICK_FORMAT},
+            "inputs": {"7": {"tick": 7, "keys": ["W"], "mouse": [], "subtick": {"W": 64}}},
+        }))
+        assert repo.load_demo(str(cache_path))
+        assert repo.get_inputs(tick=7, player_id="P1").subtick == {"W": 0.25}
+
+    def test_repository_lookup_dense_and_sparse(self, tmp_path):
+        """Test tick lookups with and without the dense tick -> row index."""
+        for last_tick in (120, 40 + MAX_DENSE_TICK_SPAN):
+            cache_path = tmp_path / f"span_{last_tick}.json"
+            cache_path.write_text(
+                '{"metadata": {"player_id": "P1"}, "inputs": {'
+                f'"{last_tick}": {{"tick": {last_tick}, "keys": ["W"], "mouse": [], "subtick": {{"W": 0.0}}}}, '
+                '"40": {"tick": 40, "keys": ["A"], "mouse": [], "subtick": {"A": 0.2}}}}'
+            )
+
+            repo = MockDemoRepository()
+            assert repo.load_demo(str(cache_path))
+
+            assert repo.get_inputs(tick=40, player_id="P1").keys == ["A"]
+            assert repo.get_inputs(tick=last_tick, player_id="P1").keys == ["W"]
+            for missing in (0, 39, 41, last_tick - 1, last_tick + 1):
+                assert repo.get_inputs(tick=missing, player_id="P1") is None
+
     @pytest.mark.asyncio
-    async def test_orchestrator_initialization(self, tmp_path):
+    async def test_orchestrator_initialization(self, mock_cache):
         """Test orchestrator initialization with all components."""
         # Setup components
-        cache_path = tmp_path / "orch_test.json"
-        generate_mock_cache(num_ticks=200, output_path=str(cache_path))
+        cache_path = mock_cache(200)
 
         tick_source = MockTickSource(start_tick=0)
         demo_repo = MockDemoRepository()
@@ -209,11 +278,10 @@ class TestDataFlow:
     """Test data flow through the system."""
 
     @pytest.mark.asyncio
-    async def test_end_to_end_data_flow(self, tmp_path):
+    async def test_end_to_end_data_flow(self, mock_cache):
         """Test complete data flow: tick → inputs → render."""
         # 1. Generate data (Phase 2)
-        cache_path = tmp_path / "e2e_cache.json"
-        generate_mock_cache(num_ticks=400, output_path=str(cache_path))
+        cache_path = mock_cache(400)
 
         # 2. Load data (Phase 1 interfaces)
         demo_repo = MockDemoRepository()
@@ -241,7 +309,7 @@ class TestDataFlow:
                 assert type(inputs).__name__ == 'InputData'
                 assert inputs.tick == current_tick
 
-            await asyncio.sleep(0.016)  # ~60 FPS
+            tick_source.advance(1)  # Next frame
 
         await tick_source.disconnect()
 
@@ -1,10 +1,15 @@
 """Tests for progress reporting functionality."""
 
+import asyncio
+import contextlib
+import functools
 import unittest
 from unittest.mock import Mock, patch
-from io import StringIO
+from io import StringIO, BytesIO, TextIOWrapper
 
-from src.utils.progress import ProgressBar, ProgressReporter
+from src.utils.progress import (
+    ProgressBar, ProgressInfo, ProgressReporter, get_progress_stream
+)
 
 
 class TestProgressBar(unittest.TestCase):
@@ -25,6 +30,43 @@ class TestProgressBar(unittest.TestCase):
         self.assertIn("█", output)
         self.assertIn("░", output)
 
+    def test_render_binary_stream(self):
+        """Test rendering through a stream's underlying binary buffer."""
+        raw = BytesIO()
+        stream = TextIOWrapper(raw, encoding='utf-8')
+        progress_bar = ProgressBar(width=20, stream=stream)
+
+        progress_bar.render(0.5, "Processing")
+
+        output = raw.getvalue().decode('utf-8')
+        self.assertIn("[" + "█" * 10 + "░" * 10 + "] 50%", output)
+        self.assertIn("Processing", output)
+
+    def test_render_tty_erases_line(self):
+        """Test that terminals get erase-to-EOL instead of space padding."""
+        class TTYStream(StringIO):
+            def isatty(self):
+                return True
+
+        stream = TTYStream()
+        progress_bar = ProgressBar(width=20, stream=stream)
+
+        progress_bar.render(0.5, "A long status message")
+        progress_bar.render(0.6, "Short")
+
+        output = stream.getvalue()
+        self.assertTrue(output.endswith("60% Short\x1b[K"))
+
+    def test_render_non_tty_one_line_per_percent(self):
+        """Test that non-terminal streams get one line per percent step."""
+        for i in range(1000):
+            self.progress_bar.render(i / 1000, "Processing")
+
+        lines = self.stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 100)
+        self.assertNotIn("\r", self.stream.getvalue())
+        self.assertTrue(lines[-1].startswith("[" + "█" * 19))
+
     def test_render_zero_progress(self):
         """Test rendering with zero progress."""
         self.progress_bar.render(0.0, "Starting")
@@ -57,6 +99,14 @@ class TestProgressBar(unittest.TestCase):
         output = self.stream.getvalue()
         self.assertIn("100%", output)
 
+    def test_render_int(self):
+        """Test rendering from integer counts."""
+        self.progress_bar.render_int(45000, 100000, "Processing tick 45000/100000")
+
+        output = self.stream.getvalue()
+        self.assertIn("[" + "█" * 9 + "░" * 11 + "] 45%", output)
+        self.assertIn("Processing tick 45000/100000", output)
+
     def test_finish(self):
         """Test finish method."""
         self.progress_bar.finish("Done!")
@@ -66,6 +116,36 @@ class TestProgressBar(unittest.TestCase):
         self.assertIn("Done!", output)
         self.assertIn("\n", output)
 
+    def test_default_stream_follows_redirected_stderr(self):
+        """Test that a redirected sys.stderr receives default progress output."""
+        redirected = StringIO()
+        with contextlib.redirect_stderr(redirected):
+            self.assertIs(get_progress_stream(), redirected)
+            ProgressBar(width=20).render(0.5, "Processing")
+
+        self.assertIn("50% Processing", redirected.getvalue())
+
+    def test_default_stream_shares_stderr_buffer(self):
+        """Test the shared stream writes through stderr's own buffer by line."""
+        raw = BytesIO()
+        stderr = TextIOWrapper(raw, encoding='utf-8', write_through=True)
+        with patch('sys.stderr', stderr), patch('sys.__stderr__', stderr), \
+                patch('src.utils.progress._progress_stream', None), \
+                patch('atexit.register') as register:
+            stream = get_progress_stream()
+            self.assertIs(get_progress_stream(), stream)
+            self.assertIs(stream.buffer, stderr.buffer)
+            self.assertTrue(stream.line_buffering)
+
+            stream.write("log line\n")
+            self.assertEqual(raw.getvalue(), b"log line\n")
+            ProgressBar(width=20).render(0.5, "Processing")
+            self.assertIn(b"50% Processing", raw.getvalue())
+
+            # Releasing at exit leaves stderr's buffer open
+            register.call_args.args[0]()
+            self.assertFalse(stderr.buffer.closed)
+
     def test_clear(self):
         """Test clear method."""
         self.progress_bar.render(0.5, "Test")
@@ -80,47 +160,55 @@ class TestProgressReporter(unittest.TestCase):
 
     def test_basic_reporting(self):
         """Test basic progress reporting."""
-        callback = Mock()
-        reporter = ProgressReporter(callback)
+        events: list[ProgressInfo] = []
+        reporter = ProgressReporter(events.append)
 
         reporter.report("extract", 0.5, "Processing...")
 
-        # Verify callback was called
-        callback.assert_called_once()
-
-        # Check callback arguments
-        call_args = callback.call_args[0][0]
-        self.assertEqual(call_args['phase'], 'extract')
-        self.assertEqual(call_args['phase_progress'], 0.5)
-        self.assertEqual(call_args['message'], "Processing...")
+        # Verify callback was called once with the progress info
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[-1].phase, 'extract')
+        self.assertEqual(events[-1].phase_progress, 0.5)
+        self.assertEqual(events[-1].message, "Processing...")
 
     def test_overall_progress_calculation(self):
         """Test overall progress calculation across phases."""
-        callback = Mock()
+        events: list[ProgressInfo] = []
         phases = {
             'extract': 0.4,
             'transform': 0.4,
             'load': 0.2
         }
-        reporter = ProgressReporter(callback, phases=phases)
+        reporter = ProgressReporter(events.append, phases=phases)
 
         # Test extract phase at 50%
         reporter.report("extract", 0.5, "Extracting...")
-        call_args = callback.call_args[0][0]
         # Should be 40% * 50% = 20% overall
-        self.assertAlmostEqual(call_args['overall_progress'], 0.2, places=2)
+        self.assertAlmostEqual(events[-1].overall_progress, 0.2, places=2)
 
         # Test transform phase at 50%
         reporter.report("transform", 0.5, "Transforming...")
-        call_args = callback.call_args[0][0]
         # Should be 40% (extract complete) + 40% * 50% = 60% overall
-        self.assertAlmostEqual(call_args['overall_progress'], 0.6, places=2)
+        self.assertAlmostEqual(events[-1].overall_progress, 0.6, places=2)
 
         # Test load phase at 50%
         reporter.report("load", 0.5, "Loading...")
-        call_args = callback.call_args[0][0]
         # Should be 80% (extract + transform) + 20% * 50% = 90% overall
-        self.assertAlmostEqual(call_args['overall_progress'], 0.9, places=2)
+        self.assertAlmostEqual(events[-1].overall_progress, 0.9, places=2)
+
+    def test_repeated_report_skipped(self):
+        """Test that identical consecutive reports call the callback once."""
+        events: list[ProgressInfo] = []
+        reporter = ProgressReporter(events.append)
+
+        reporter.report("extract", 0.5, "Processing...")
+        reporter.report("extract", 0.5, "Processing...")
+        reporter.report("extract", 0.5001, "Processing...")
+
+        self.assertEqual(len(events), 1)
+
+        reporter.report("extract", 0.6, "Processing...")
+        self.assertEqual(len(events), 2)
 
     def test_no_callback(self):
         """Test reporter with no callback doesn't crash."""
@@ -137,22 +225,92 @@ class TestProgressReporter(unittest.TestCase):
         reporter = ProgressReporter(failing_callback)
 
         # Should not raise an error
-        with patch('src.utils.progress.logging.getLogger') as mock_logger:
+        with patch.object(reporter, '_log') as mock_logger:
             reporter.report("extract", 0.5, "Processing...")
             # Verify warning was logged
-            mock_logger.return_value.warning.assert_called()
+            mock_logger.warning.assert_called()
+
+    def test_async_callback_without_running_loop(self):
+        """Test async callbacks are delivered by flush() outside a loop."""
+        received = []
+
+        async def async_callback(info):
+            received.append(info['phase_progress'])
+
+        reporter = ProgressReporter(async_callback)
+
+        reporter.report("extract", 0.25, "Quarter")
+        reporter.report("extract", 0.5, "Half")
+        reporter.flush(timeout=5)
+
+        self.assertEqual(received, [0.25, 0.5])
+
+    def test_async_partial_callback(self):
+        """Test callables that return coroutines are awaited as well."""
+        received = []
+
+        async def async_callback(tag, info):
+            received.append((tag, info['phase']))
+
+        reporter = ProgressReporter(functools.partial(async_callback, "etl"))
+
+        reporter.report("load", 0.5, "Saving...")
+        reporter.flush(timeout=5)
+
+        self.assertEqual(received, [("etl", "load")])
+
+    def test_async_callback_inside_running_loop(self):
+        """Test async callbacks in a running loop are kept until they finish."""
+        received = []
+
+        async def async_callback(info):
+            received.append(info.phase)
+
+        async def run():
+            reporter = ProgressReporter(async_callback)
+            reporter.report("extract", 0.5, "Processing...")
+            self.assertEqual(len(reporter._tasks), 1)
+
+            await asyncio.gather(*reporter._tasks)
+            self.assertEqual(received, ["extract"])
+            self.assertEqual(reporter._tasks, set())
+
+        asyncio.run(run())
+
+    def test_aflush_inside_running_loop(self):
+        """Test aflush() awaits callbacks on the loop and flush() warns about them."""
+        received = []
+
+        async def async_callback(info):
+            await asyncio.sleep(0.01)
+            received.append(info.phase)
+
+        async def run():
+            reporter = ProgressReporter(async_callback)
+            reporter.report("extract", 0.5, "Processing...")
+            reporter.report("load", 0.5, "Saving...")
+
+            with patch.object(reporter, '_log') as mock_logger:
+                reporter.flush(timeout=5)
+                mock_logger.warning.assert_called_once()
+            self.assertEqual(received, [])
+
+            await reporter.aflush(timeout=5)
+            self.assertEqual(received, ["extract", "load"])
+            self.assertEqual(reporter._tasks, set())
+
+        asyncio.run(run())
 
     def test_unknown_phase(self):
         """Test handling of unknown phase."""
-        callback = Mock()
-        reporter = ProgressReporter(callback)
+        events: list[ProgressInfo] = []
+        reporter = ProgressReporter(events.append)
 
         reporter.report("unknown_phase", 0.5, "Processing...")
 
         # Should still call callback with the phase progress
-        call_args = callback.call_args[0][0]
-        self.assertEqual(call_args['phase'], 'unknown_phase')
-        self.assertEqual(call_args['phase_progress'], 0.5)
+        self.assertEqual(events[-1].phase, 'unknown_phase')
+        self.assertEqual(events[-1].phase_progress, 0.5)
 
 
 class TestProgressIntegration(unittest.TestCase):
@@ -174,8 +332,8 @@ class TestProgressIntegration(unittest.TestCase):
 
     def test_progress_callback_format(self):
         """Test that progress callback receives correct format."""
-        callback = Mock()
-        reporter = ProgressReporter(callback)
+        events: list[ProgressInfo] = []
+        reporter = ProgressReporter(events.append)
 
         # Simulate ETL phases
         reporter.report("extract", 0.0, "Starting extraction...")
@@ -183,14 +341,24 @@ class TestProgressIntegration(unittest.TestCase):
         reporter.report("extract", 1.0, "Extracted 100000 events")
 
         # Verify all calls
-        self.assertEqual(callback.call_count, 3)
+        self.assertEqual(len(events), 3)
 
         # Check the format of the last call
-        call_args = callback.call_args[0][0]
-        self.assertIn('phase', call_args)
-        self.assertIn('phase_progress', call_args)
-        self.assertIn('overall_progress', call_args)
-        self.assertIn('message', call_args)
+        self.assertIsInstance(events[-1], ProgressInfo)
+        self.assertEqual(events[-1].phase, 'extract')
+        self.assertEqual(events[-1].message, "Extracted 100000 events")
+
+    def test_progress_info_dict_access(self):
+        """Test that progress events still support dict-style callbacks."""
+        info = ProgressInfo('extract', 0.5, 0.2, "Processing...")
+
+        self.assertEqual(info['phase'], 'extract')
+        self.assertEqual(info.get('overall_progress', 0.0), 0.2)
+        self.assertEqual(info.get('missing', 'default'), 'default')
+        self.assertIn('message', info)
+        self.assertNotIn('missing', info)
+        with self.assertRaises(KeyError):
+            info['missing']
 
 
 if __name__ == '__main__':